@@ -1,5 +1,7 @@
 import itertools
 
+from Motor_CSP import CSPColoreo, acondicionamiento_corte, ciclo_corte
+
 # Grafo con ciclos
 grafo = {
     'A': ['B', 'C'],
@@ -11,8 +13,9 @@ grafo = {
 
 colores = ['Rojo', 'Verde', 'Azul']
 
-# Identificar un cutset (por simplicidad, elegimos manualmente)
-cutset = ['B']
+# Identificar un cutset automáticamente (poda de hojas + vértice de mayor grado)
+csp = CSPColoreo(grafo, colores)
+cutset = [csp.variables[i] for i in ciclo_corte(csp)]
 
 # Verifica si una asignación es válida
 def es_valida(asignacion, grafo):
@@ -45,18 +48,30 @@ def resolver_restante(asignacion_parcial, grafo, colores):
 
     return backtrack(asignacion_parcial.copy())
 
-# Enumerar todas las asignaciones posibles del cutset
-for valores in itertools.product(colores, repeat=len(cutset)):
-    asignacion_cutset = dict(zip(cutset, valores))
-    if not es_valida(asignacion_cutset, grafo):
-        continue
+if __name__ == "__main__":
+    print("Cutset:", cutset)
+
+    # Enumerar todas las asignaciones posibles del cutset
+    for valores in itertools.product(colores, repeat=len(cutset)):
+        asignacion_cutset = dict(zip(cutset, valores))
+        if not es_valida(asignacion_cutset, grafo):
+            continue
+
+        # Resolver el resto
+        resultado = resolver_restante(asignacion_cutset, grafo, colores)
+        if resultado:
+            print("Solución encontrada:")
+            for nodo, color in resultado.items():
+                print(f"{nodo} → {color}")
+            break
+    else:
+        print("No se encontró una solución sin conflictos.")
 
-    # Resolver el resto
-    resultado = resolver_restante(asignacion_cutset, grafo, colores)
+    # Corte automático + resolvedor de árboles, repartiendo el corte entre procesos
+    resultado = acondicionamiento_corte(csp, procesos=2)
     if resultado:
-        print("Solución encontrada:")
+        print("Solución encontrada con el resolvedor de árboles:")
         for nodo, color in resultado.items():
             print(f"{nodo} → {color}")
-        break
-else:
-    print("No se encontró una solución sin conflictos.")
+    else:
+        print("No se encontró una solución sin conflictos con el resolvedor de árboles.")
@@ -0,0 +1,147 @@
+import multiprocessing
+import queue
+import random
+import sys
+import time
+
+from Motor_CSP import (CSPColoreo, RedRestricciones, acondicionamiento_corte, backtracking_bits, cbj_bits, dsatur,
+                       forward_checking_bits, min_conflicts_bits, nogoods_bits)
+
+# Banco de pruebas: corre cada resolvedor sobre familias de instancias de coloreo
+# y reporta tiempo, retrocesos y propagaciones. Cada ejecución va en un proceso
+# aparte para poder cortarla al llegar al tiempo límite.
+
+TIEMPO_LIMITE = 10  # segundos por resolvedor e instancia
+
+# Grado medio cerca de la transición de fase de k-colorabilidad en grafos aleatorios
+GRADO_TRANSICION = {3: 4.69, 4: 8.9, 5: 13.7}
+
+def grafo_aleatorio(n, grado_medio, semilla=None):
+    """Grafo aleatorio G(n, m) con m = n * grado_medio / 2 aristas distintas"""
+    rng = random.Random(semilla)
+    grafo = {v: set() for v in range(n)}
+    m = round(n * grado_medio / 2)
+    aristas = 0
+    while aristas < m:
+        u, v = rng.sample(range(n), 2)
+        if v not in grafo[u]:
+            grafo[u].add(v)
+            grafo[v].add(u)
+            aristas += 1
+    return grafo
+
+def grafo_mycielski(orden):
+    """Grafo de Mycielski M_orden: sin triángulos y con número cromático `orden`"""
+    grafo = {0: {1}, 1: {0}}
+    for _ in range(orden - 2):
+        n = len(grafo)
+        nuevo = {v: set(vs) for v, vs in grafo.items()}
+        for v in range(n):
+            nuevo[n + v] = set()
+        for v, vs in grafo.items():
+            for u in vs:
+                nuevo[n + v].add(u)
+                nuevo[u].add(n + v)
+        nuevo[2 * n] = set(range(n, 2 * n))
+        for v in range(n, 2 * n):
+            nuevo[v].add(2 * n)
+        grafo = nuevo
+    return grafo
+
+def grafo_reinas(lado):
+    """Grafo de reinas: casillas unidas si una reina en una ataca a la otra"""
+    grafo = {}
+    for f in range(lado):
+        for c in range(lado):
+            grafo[(f, c)] = [(g, d) for g in range(lado) for d in range(lado)
+                             if (g, d) != (f, c) and (g == f or d == c or abs(g - f) == abs(d - c))]
+    return grafo
+
+def instancias_estandar():
+    """Pares (nombre, csp) de las familias generadas aquí"""
+    for orden in (4, 5, 6):
+        # Con orden - 1 colores no hay solución: pone a prueba la demostración de insatisfacibilidad
+        for k in (orden - 1, orden):
+            yield f"myciel{orden} k={k}", CSPColoreo(grafo_mycielski(orden), k)
+    for lado in (5, 6, 7):
+        yield f"queen{lado}_{lado} k={lado}", CSPColoreo(grafo_reinas(lado), lado)
+    for k, grado in GRADO_TRANSICION.items():
+        for n in (50, 100, 200):
+            for semilla in range(2):
+                yield (f"aleatorio n={n} d={grado} k={k} s={semilla}",
+                       CSPColoreo(grafo_aleatorio(n, grado, semilla), k))
+
+# Adaptadores con la misma firma (csp, estadisticas) para todos los resolvedores
+def _mac_ac3(csp, estadisticas):
+    grafo = {v: [csp.variables[u] for u in csp.vecinos[i]] for i, v in enumerate(csp.variables)}
+    return RedRestricciones.desde_grafo(grafo, csp.colores).mac(estadisticas)
+
+def _min_conflicts(csp, estadisticas):
+    inicial, _ = dsatur(csp, csp.k)
+    return min_conflicts_bits(csp, max_pasos=200000, inicial=inicial, semilla=0, estadisticas=estadisticas)
+
+def _corte(csp, estadisticas):
+    return acondicionamiento_corte(csp, estadisticas=estadisticas)
+
+RESOLVEDORES = {
+    'backtracking': lambda csp, e: backtracking_bits(csp, estadisticas=e),
+    'forward_checking': lambda csp, e: forward_checking_bits(csp, estadisticas=e),
+    'ac3 (MAC)': _mac_ac3,
+    'min_conflicts': _min_conflicts,
+    'corte': _corte,
+    'cbj': lambda csp, e: cbj_bits(csp, estadisticas=e),
+    'nogoods': lambda csp, e: nogoods_bits(csp, estadisticas=e),
+}
+
+def _ejecutar(nombre, csp, cola):
+    estadisticas = {}
+    inicio = time.perf_counter()
+    solucion = RESOLVEDORES[nombre](csp, estadisticas)
+    segundos = time.perf_counter() - inicio
+    if solucion is None:
+        resultado = 'sin solución' if nombre != 'min_conflicts' else 'agotado'
+    else:
+        resultado = 'solución' if csp.es_solucion(solucion) else 'INVÁLIDA'
+    cola.put((resultado, segundos, estadisticas))
+
+def medir(nombre, csp, tiempo_limite=TIEMPO_LIMITE):
+    """Devuelve (resultado, segundos, estadísticas) o ('límite', tiempo_limite, {})"""
+    cola = multiprocessing.Queue()
+    proceso = multiprocessing.Process(target=_ejecutar, args=(nombre, csp, cola), daemon=True)
+    proceso.start()
+    try:
+        return cola.get(timeout=tiempo_limite)
+    except queue.Empty:
+        return 'límite', tiempo_limite, {}
+    finally:
+        if proceso.is_alive():
+            proceso.terminate()
+        proceso.join()
+
+def banco(instancias, resolvedores=None, tiempo_limite=TIEMPO_LIMITE):
+    """Corre cada resolvedor sobre cada instancia e imprime una fila por ejecución"""
+    resolvedores = list(resolvedores or RESOLVEDORES)
+    print(f"{'instancia':<34} {'resolvedor':<17} {'resultado':<13} {'segundos':>9} "
+          f"{'retrocesos':>11} {'propagaciones':>14}")
+    filas = []
+    for nombre_instancia, csp in instancias:
+        for nombre in resolvedores:
+            resultado, segundos, estadisticas = medir(nombre, csp, tiempo_limite)
+            retrocesos = estadisticas.get('retrocesos', '-')
+            propagaciones = estadisticas.get('propagaciones', '-')
+            print(f"{nombre_instancia:<34} {nombre:<17} {resultado:<13} {segundos:>9.3f} "
+                  f"{retrocesos:>11} {propagaciones:>14}")
+            filas.append((nombre_instancia, nombre, resultado, segundos, estadisticas))
+    return filas
+
+if __name__ == "__main__":
+    # Uso: python Banco_de_Pruebas_CSP.py [archivo.col:k ...]
+    # Sin argumentos se usan las familias generadas (Mycielski, reinas, aleatorios)
+    if sys.argv[1:]:
+        instancias = []
+        for argumento in sys.argv[1:]:
+            ruta, _, k = argumento.rpartition(':')
+            instancias.append((f"{ruta} k={k}", CSPColoreo.desde_dimacs(ruta, int(k))))
+    else:
+        instancias = instancias_estandar()
+    banco(instancias)
@@ -1,5 +1,7 @@
 import random
 
+from Motor_CSP import CSPColoreo, dsatur, min_conflicts_bits
+
 # Definimos el grafo
 grafo = {
     'A': ['B', 'C'],
@@ -11,9 +13,11 @@ grafo = {
 colores = ['Rojo', 'Verde', 'Azul']
 max_intentos = 1000
 
-# Inicialización aleatoria
+# Inicialización con DSatur limitado a los colores disponibles: parte de pocos conflictos
 def inicializar_asignacion(grafo, colores):
-    return {nodo: random.choice(colores) for nodo in grafo}
+    csp = CSPColoreo(grafo, colores)
+    color, _ = dsatur(csp, csp.k)
+    return csp.decodificar(color)
 
 # Contar conflictos de un nodo
 def contar_conflictos(nodo, color, asignacion, grafo):
@@ -47,12 +51,26 @@ def min_conflicts(grafo, colores, max_intentos=1000):
 
     return None  # No se encontró solución en los intentos dados
 
-# Ejecutar
-resultado = min_conflicts(grafo, colores, max_intentos)
+if __name__ == "__main__":
+    # Ejecutar
+    resultado = min_conflicts(grafo, colores, max_intentos)
+
+    if resultado:
+        print("Solución encontrada:")
+        for nodo, color in resultado.items():
+            print(f"{nodo} → {color}")
+    else:
+        print("No se encontró una solución sin conflictos.")
+
+    # Cuentas de conflicto incrementales, caminata aleatoria y lista tabú,
+    # partiendo del coloreo DSatur
+    csp = CSPColoreo(grafo, colores)
+    inicial, _ = dsatur(csp, csp.k)
+    resultado = min_conflicts_bits(csp, max_intentos, tenencia_tabu=2, inicial=inicial)
 
-if resultado:
-    print("Solución encontrada:")
-    for nodo, color in resultado.items():
-        print(f"{nodo} → {color}")
-else:
-    print("No se encontró una solución sin conflictos.")
+    if resultado:
+        print("Solución encontrada con cuentas incrementales:")
+        for nodo, color in resultado.items():
+            print(f"{nodo} → {color}")
+    else:
+        print("No se encontró una solución sin conflictos con cuentas incrementales.")
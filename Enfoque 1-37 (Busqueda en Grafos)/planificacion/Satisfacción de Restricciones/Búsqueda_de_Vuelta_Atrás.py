@@ -1,3 +1,5 @@
+from Motor_CSP import CSPColoreo, backtracking_bits, contar_soluciones, enumerar_soluciones
+
 # Grafo representado como un diccionario de adyacencias
 grafo = {
     'A': ['B', 'C'],
@@ -33,10 +35,28 @@ def backtracking(nodo_index=0, nodos=list(grafo.keys())):
             del asignacion[nodo]  # Deshace la asignación si no funciona
     return False
 
-# Ejecutar la búsqueda
-if backtracking():
-    print("Solución encontrada:")
-    for nodo, color in asignacion.items():
-        print(f"{nodo} → {color}")
-else:
-    print("No se encontró una solución válida.")
+if __name__ == "__main__":
+    # Ejecutar la búsqueda
+    if backtracking():
+        print("Solución encontrada:")
+        for nodo, color in asignacion.items():
+            print(f"{nodo} → {color}")
+    else:
+        print("No se encontró una solución válida.")
+
+    # Misma búsqueda con dominios como máscaras de bits, MRV + grado + LCV
+    # y ruptura de simetría entre colores intercambiables
+    resultado = backtracking_bits(CSPColoreo(grafo, colores), romper_simetria=True)
+    if resultado:
+        print("Solución encontrada con el motor de bits:")
+        for nodo, color in resultado.items():
+            print(f"{nodo} → {color}")
+    else:
+        print("No se encontró una solución válida con el motor de bits.")
+
+    # Todas las soluciones, generadas una a una, y su número por programación
+    # dinámica sobre la descomposición en árbol
+    csp = CSPColoreo(grafo, colores)
+    print("Número de soluciones:", contar_soluciones(csp))
+    for i, solucion in enumerate(enumerar_soluciones(csp), 1):
+        print(f"Solución {i}:", ", ".join(f"{nodo} → {color}" for nodo, color in solucion.items()))
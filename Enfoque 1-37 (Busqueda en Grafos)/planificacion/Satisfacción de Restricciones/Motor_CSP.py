@@ -0,0 +1,1668 @@
+import copy
+import heapq
+import itertools
+import multiprocessing
+import queue
+import random
+import time
+from array import array
+from operator import itemgetter
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# Motor reutilizable para problemas de coloreo de grafos (CSP con restricciones !=).
+# Cada color se representa con un bit, cada dominio es un entero usado como máscara
+# de bits y los vecinos de cada variable se guardan como arreglos de enteros.
+
+class CSPColoreo:
+    def __init__(self, grafo, colores):
+        """
+        Construye la representación compacta de un problema de coloreo
+
+        Args:
+            grafo: Diccionario nodo -> lista de nodos vecinos
+            colores: Lista de colores disponibles
+        """
+        indice = {v: i for i, v in enumerate(grafo)}
+        # Las adyacencias se hacen simétricas y sin lazos
+        adyacentes = [set() for _ in grafo]
+        for v, vecinos in grafo.items():
+            i = indice[v]
+            for u in vecinos:
+                j = indice[u]
+                if i != j:
+                    adyacentes[i].add(j)
+                    adyacentes[j].add(i)
+        self._preparar(list(grafo), colores, adyacentes)
+
+    def _preparar(self, variables, colores, adyacentes):
+        self.variables = variables
+        self.indice = {v: i for i, v in enumerate(variables)}
+        self.colores = list(range(colores)) if isinstance(colores, int) else list(colores)
+        self.k = len(self.colores)
+        self.todos = (1 << self.k) - 1  # Máscara con todos los colores
+        self.vecinos = [array('i', sorted(set(a))) for a in adyacentes]
+        self.grados = array('i', (len(a) for a in self.vecinos))
+
+    @classmethod
+    def desde_dimacs(cls, ruta, colores):
+        """
+        Lee una instancia DIMACS de coloreo (.col) línea a línea y vuelca las
+        aristas "e u v" directamente en arreglos de adyacencia, sin pasar por
+        un diccionario. Los vértices se llaman 1..n como en el archivo;
+        `colores` es la lista de colores o su número.
+        """
+        adyacentes = None
+        with open(ruta, encoding='ascii', errors='replace') as archivo:
+            for numero, linea in enumerate(archivo, 1):
+                if linea.startswith('e'):
+                    if adyacentes is None:
+                        raise ValueError(f"{ruta}:{numero}: arista antes de la línea 'p'")
+                    partes = linea.split()
+                    u, v = int(partes[1]) - 1, int(partes[2]) - 1
+                    if u != v:
+                        adyacentes[u].append(v)
+                        adyacentes[v].append(u)
+                elif linea.startswith('p'):
+                    n = int(linea.split()[2])
+                    adyacentes = [array('i') for _ in range(n)]
+        if adyacentes is None:
+            raise ValueError(f"{ruta}: falta la línea 'p edge n m'")
+        csp = cls.__new__(cls)
+        csp._preparar(list(range(1, len(adyacentes) + 1)), colores, adyacentes)
+        return csp
+
+    def con_colores(self, colores):
+        """Mismo grafo con otra lista (o número) de colores; comparte los arreglos de vecinos"""
+        csp = copy.copy(self)
+        csp.colores = list(range(colores)) if isinstance(colores, int) else list(colores)
+        csp.k = len(csp.colores)
+        csp.todos = (1 << csp.k) - 1
+        return csp
+
+    def __len__(self):
+        return len(self.variables)
+
+    def decodificar(self, valores):
+        """Convierte un arreglo de índices de color en un diccionario nodo -> color"""
+        return {v: self.colores[valores[i]] for i, v in enumerate(self.variables) if valores[i] >= 0}
+
+    def es_solucion(self, asignacion):
+        """Verifica que una asignación completa (nodo -> color) no tenga conflictos"""
+        if len(asignacion) != len(self.variables):
+            return False
+        for i, v in enumerate(self.variables):
+            for j in self.vecinos[i]:
+                if asignacion[v] == asignacion[self.variables[j]]:
+                    return False
+        return True
+
+def permitidos_simetria(usados, todos):
+    """Colores ya usados más un único color nuevo (el de menor índice sin usar)"""
+    libres = todos & ~usados
+    return usados | (libres & -libres)
+
+def registrar(estadisticas, **cuentas):
+    """Suma las cuentas de una ejecución al diccionario `estadisticas`, si se dio"""
+    if estadisticas is not None:
+        for clave, valor in cuentas.items():
+            estadisticas[clave] = estadisticas.get(clave, 0) + valor
+
+def backtracking_bits(csp, romper_simetria=False, estadisticas=None):
+    """
+    Vuelta atrás iterativa con MRV + grado + valor menos restrictivo.
+
+    Para cada variable se mantiene cuántos vecinos asignados usan cada color;
+    el dominio es la máscara de colores con cuenta cero. La variable con menos
+    colores libres (desempate por mayor grado) se obtiene de un montículo con
+    entradas perezosas. Con `romper_simetria`, como los colores son
+    intercambiables, una variable sólo prueba los colores ya usados y un
+    color nuevo, lo que evita explorar hasta k! veces cada subárbol fallido.
+    En `estadisticas` se suman los retrocesos y los colores eliminados de
+    los dominios ('propagaciones'). Devuelve el diccionario nodo -> color o None.
+    """
+    n, k = len(csp), csp.k
+    vecinos, grados = csp.vecinos, csp.grados
+    valores = array('i', [-1]) * n
+    cuenta = array('i', [0]) * (n * k)
+    dominio = [csp.todos] * n
+    monticulo = [(k, -grados[v], v) for v in range(n)]
+    heapq.heapify(monticulo)
+    uso = [0] * k  # Cuántas variables tienen cada color
+    usados = 0
+    retrocesos = eliminados = 0
+
+    def seleccionar():
+        while monticulo:
+            d, _, v = monticulo[0]
+            if valores[v] == -1 and dominio[v].bit_count() == d:
+                heapq.heappop(monticulo)
+                return v
+            heapq.heappop(monticulo)
+        return None
+
+    def ordenar_valores(v):
+        # Valor menos restrictivo: el color que menos vecinos libres pierden
+        opciones = []
+        d = dominio[v]
+        if romper_simetria:
+            d &= permitidos_simetria(usados, csp.todos)
+        while d:
+            bit = d & -d
+            d ^= bit
+            c = bit.bit_length() - 1
+            eliminados = sum(1 for u in vecinos[v] if valores[u] == -1 and dominio[u] & bit)
+            opciones.append((eliminados, c))
+        opciones.sort()
+        return [c for _, c in opciones]
+
+    def asignar(v, c):
+        nonlocal usados, eliminados
+        valores[v] = c
+        bit = 1 << c
+        uso[c] += 1
+        usados |= bit
+        for u in vecinos[v]:
+            i = u * k + c
+            cuenta[i] += 1
+            if cuenta[i] == 1:
+                eliminados += 1
+                dominio[u] &= ~bit
+                if valores[u] == -1:
+                    heapq.heappush(monticulo, (dominio[u].bit_count(), -grados[u], u))
+
+    def desasignar(v):
+        nonlocal usados
+        c = valores[v]
+        valores[v] = -1
+        bit = 1 << c
+        uso[c] -= 1
+        if not uso[c]:
+            usados &= ~bit
+        for u in vecinos[v]:
+            i = u * k + c
+            cuenta[i] -= 1
+            if cuenta[i] == 0:
+                dominio[u] |= bit
+                if valores[u] == -1:
+                    heapq.heappush(monticulo, (dominio[u].bit_count(), -grados[u], u))
+
+    pila = []  # Marcos [variable, colores ordenados, siguiente posición]
+    while True:
+        v = seleccionar()
+        if v is None:
+            registrar(estadisticas, retrocesos=retrocesos, propagaciones=eliminados)
+            return csp.decodificar(valores)
+        pila.append([v, ordenar_valores(v), 0])
+
+        # Probar el siguiente color del marco superior; si se agotan, retroceder
+        while pila:
+            marco = pila[-1]
+            v, opciones, pos = marco
+            if valores[v] != -1:
+                desasignar(v)
+                retrocesos += 1
+            if pos < len(opciones):
+                marco[2] = pos + 1
+                asignar(v, opciones[pos])
+                break
+            pila.pop()
+            heapq.heappush(monticulo, (dominio[v].bit_count(), -grados[v], v))
+        else:
+            registrar(estadisticas, retrocesos=retrocesos, propagaciones=eliminados)
+            return None
+
+def forward_checking_bits(csp, romper_simetria=False, estadisticas=None):
+    """
+    Comprobación hacia delante con dominios como máscaras de bits.
+
+    Cada cambio de dominio se apila en un rastro (variable, dominio anterior)
+    y se deshace en O(1) por entrada al retroceder. Las variables libres están
+    en cubetas según el tamaño de su dominio; cada cubeta es un montículo por
+    número de vecinos libres, que se mantiene al asignar y desasignar, así que
+    la selección es MRV con desempate por grado dinámico (las entradas
+    obsoletas se descartan al sacarlas). Los colores se prueban en orden de
+    valor menos restrictivo, desempatando a favor del último color que tuvo
+    la variable. `romper_simetria` limita cada variable a los colores usados
+    más uno nuevo, igual que en backtracking_bits, y `estadisticas` recibe los
+    retrocesos y las reducciones de dominio. Devuelve nodo -> color o None.
+    """
+    return next(enumerar_soluciones(csp, romper_simetria, estadisticas), None)
+
+def enumerar_soluciones(csp, romper_simetria=False, estadisticas=None):
+    """
+    Generador que produce, una a una y sin construir listas, todas las
+    soluciones (nodo -> color) usando la misma búsqueda que
+    forward_checking_bits. Con `romper_simetria` sólo se produce un
+    representante por cada permutación de colores. Las cuentas de
+    `estadisticas` se actualizan antes de producir cada solución.
+    """
+    n, k = len(csp), csp.k
+    vecinos = csp.vecinos
+    valores = array('i', [-1]) * n
+    fase = array('i', [-1]) * n  # Último color de cada variable
+    dominio = [csp.todos] * n
+    libres = array('i', csp.grados)  # Vecinos sin asignar de cada variable
+    cubetas = [[] for _ in range(k + 1)]  # Montículos de (-vecinos libres, variable)
+    cubetas[k].extend((-libres[v], v) for v in range(n))
+    heapq.heapify(cubetas[k])
+    rastro = []  # (variable, dominio anterior)
+    uso = [0] * k
+    usados = 0
+    retrocesos = eliminados = 0
+
+    def seleccionar():
+        for d, cubeta in enumerate(cubetas):
+            while cubeta:
+                g, v = heapq.heappop(cubeta)
+                if valores[v] == -1 and dominio[v].bit_count() == d and -g == libres[v]:
+                    return v
+        return None
+
+    def encolar(u):
+        heapq.heappush(cubetas[dominio[u].bit_count()], (-libres[u], u))
+
+    def ordenar_valores(v, d):
+        # Valor menos restrictivo; a igualdad, primero el último color de v
+        opciones = []
+        while d:
+            bit = d & -d
+            d ^= bit
+            c = bit.bit_length() - 1
+            quita = sum(1 for u in vecinos[v] if valores[u] == -1 and dominio[u] & bit)
+            opciones.append((quita, c != fase[v], c))
+        opciones.sort()
+        return [c for _, _, c in opciones]
+
+    def asignar(v, c):
+        # Devuelve False si algún vecino queda sin valores. Recorre todos los
+        # vecinos aunque falle, para que los grados libres se deshagan igual
+        nonlocal usados, eliminados
+        valores[v] = fase[v] = c
+        bit = 1 << c
+        uso[c] += 1
+        usados |= bit
+        consistente = True
+        for u in vecinos[v]:
+            libres[u] -= 1
+            if valores[u] == -1:
+                if dominio[u] & bit:
+                    eliminados += 1
+                    rastro.append((u, dominio[u]))
+                    dominio[u] &= ~bit
+                    if not dominio[u]:
+                        consistente = False
+                encolar(u)
+        return consistente
+
+    def desasignar(v, marca):
+        # Las entradas del rastro desde la marca son todas vecinos de v
+        nonlocal usados
+        while len(rastro) > marca:
+            u, anterior = rastro.pop()
+            dominio[u] = anterior
+        c = valores[v]
+        valores[v] = -1
+        uso[c] -= 1
+        if not uso[c]:
+            usados &= ~(1 << c)
+        for u in vecinos[v]:
+            libres[u] += 1
+            if valores[u] == -1:
+                encolar(u)
+
+    pila = []  # Marcos [variable, colores ordenados, siguiente posición, marca del rastro]
+    while True:
+        v = seleccionar()
+        if v is None:
+            registrar(estadisticas, retrocesos=retrocesos, propagaciones=eliminados)
+            retrocesos = eliminados = 0
+            yield csp.decodificar(valores)
+        else:
+            pendientes = dominio[v]
+            if romper_simetria:
+                pendientes &= permitidos_simetria(usados, csp.todos)
+            pila.append([v, ordenar_valores(v, pendientes), 0, len(rastro)])
+
+        while pila:
+            marco = pila[-1]
+            v, opciones, pos, marca = marco
+            if valores[v] != -1:
+                retrocesos += 1
+                desasignar(v, marca)
+            if pos == len(opciones):
+                pila.pop()
+                encolar(v)
+                continue
+            marco[2] = pos + 1
+            if asignar(v, opciones[pos]):
+                break
+        else:
+            registrar(estadisticas, retrocesos=retrocesos, propagaciones=eliminados)
+            return
+
+def _bitset(posiciones, tam):
+    # Construye el entero con los bits `posiciones` en O(tam / 8), sin desplazamientos repetidos
+    bytes_ = bytearray((tam + 7) // 8)
+    for p in posiciones:
+        bytes_[p >> 3] |= 1 << (p & 7)
+    return int.from_bytes(bytes_, 'little')
+
+class RestriccionTabla:
+    def __init__(self, alcance, tuplas, tam_dominios):
+        """
+        Restricción en extensión con propagación compact-table.
+
+        El conjunto de tuplas aún válidas es un bitset (un entero de Python,
+        así que AND/OR recorren palabras enteras en C) y para cada (posición,
+        valor) se precalcula la máscara de tuplas que lo soportan. El estado
+        reversible de la restricción es (tuplas válidas, dominios vistos):
+        inmutable, así que guardarlo y restaurarlo cuesta O(1).
+
+        Args:
+            alcance: Lista de índices de variables
+            tuplas: Tuplas permitidas, como índices de valor por posición
+            tam_dominios: Tamaño del dominio de cada variable del alcance
+        """
+        self.alcance = list(alcance)
+        posiciones = [[[] for _ in range(tam)] for tam in tam_dominios]
+        for t, tupla in enumerate(tuplas):
+            for pos, a in enumerate(tupla):
+                posiciones[pos][a].append(t)
+        self.soportes = [[_bitset(ps, len(tuplas)) for ps in por_valor] for por_valor in posiciones]
+        self.estado_inicial = ((1 << len(tuplas)) - 1, tuple((1 << tam) - 1 for tam in tam_dominios))
+
+    def filtrar(self, dominio, estado):
+        """
+        Actualiza las tuplas válidas con los valores quitados desde la última
+        vez y poda los valores que se quedaron sin soporte.
+
+        Por variable se usa la actualización incremental (quitar las máscaras
+        de los valores eliminados) o la de reinicio (unir las de los valores
+        que quedan), la que recorra menos máscaras. Modifica `dominio` y
+        devuelve (nuevo estado, [(variable, valores quitados)]) o None si ya
+        no queda ninguna tupla.
+        """
+        validas, vistos = estado
+        for pos, x in enumerate(self.alcance):
+            d, antes = dominio[x], vistos[pos]
+            if d == antes:
+                continue
+            quitados = antes & ~d
+            mascaras = self.soportes[pos]
+            union = 0
+            if quitados.bit_count() < d.bit_count():
+                while quitados:
+                    bit = quitados & -quitados
+                    quitados ^= bit
+                    union |= mascaras[bit.bit_length() - 1]
+                validas &= ~union
+            else:
+                while d:
+                    bit = d & -d
+                    d ^= bit
+                    union |= mascaras[bit.bit_length() - 1]
+                validas &= union
+        if not validas:
+            return None
+
+        cambios = []
+        for pos, x in enumerate(self.alcance):
+            mascaras = self.soportes[pos]
+            d = resto = dominio[x]
+            while resto:
+                bit = resto & -resto
+                resto ^= bit
+                if not mascaras[bit.bit_length() - 1] & validas:
+                    d ^= bit
+            if d != dominio[x]:
+                cambios.append((x, dominio[x] & ~d))
+                dominio[x] = d
+        return (validas, tuple(dominio[x] for x in self.alcance)), cambios
+
+class RedRestricciones:
+    def __init__(self, dominios):
+        """
+        Red de restricciones binarias arbitrarias y de tablas sobre dominios finitos
+
+        Args:
+            dominios: Diccionario variable -> lista de valores posibles
+        """
+        self.variables = list(dominios)
+        self.indice = {v: i for i, v in enumerate(self.variables)}
+        self.valores = [list(dominios[v]) for v in self.variables]
+        self.dominio = [(1 << len(vals)) - 1 for vals in self.valores]
+        # soportes[(i, j)][a] = máscara de valores de j compatibles con el valor a de i
+        self.soportes = {}
+        self.vecinos = [[] for _ in self.variables]
+        self.tablas = []
+        self.tablas_de = [[] for _ in self.variables]  # Índices de las tablas de cada variable
+
+    @classmethod
+    def desde_grafo(cls, grafo, colores):
+        """Red de coloreo: una restricción != por cada arista del grafo"""
+        red = cls({v: colores for v in grafo})
+        for v, vecinos in grafo.items():
+            for u in vecinos:
+                if (red.indice[v], red.indice[u]) not in red.soportes:
+                    red.agregar_restriccion(v, u, lambda a, b: a != b)
+        return red
+
+    def agregar_restriccion(self, xi, xj, relacion):
+        """
+        Añade una restricción entre xi y xj.
+
+        `relacion` puede ser un predicado relacion(a, b) o una matriz de
+        compatibilidad ya calculada: una lista con una máscara de bits por
+        valor de xi (bit b activo si el valor b de xj es compatible). Si ya
+        había una restricción entre ambas variables, se combinan con AND.
+        """
+        i, j = self.indice[xi], self.indice[xj]
+        if callable(relacion):
+            matriz = [sum(1 << b for b, vb in enumerate(self.valores[j]) if relacion(va, vb))
+                      for va in self.valores[i]]
+        else:
+            matriz = list(relacion)
+        transpuesta = [sum(1 << a for a, m in enumerate(matriz) if m >> b & 1)
+                       for b in range(len(self.valores[j]))]
+
+        for (p, q), m in (((i, j), matriz), ((j, i), transpuesta)):
+            if (p, q) in self.soportes:
+                self.soportes[(p, q)] = [x & y for x, y in zip(self.soportes[(p, q)], m)]
+            else:
+                self.soportes[(p, q)] = m
+                self.vecinos[p].append(q)
+
+    def agregar_tabla(self, alcance, tuplas):
+        """
+        Añade una restricción en extensión: `alcance` es una lista de
+        variables y `tuplas` las combinaciones de valores permitidas. Las
+        tuplas con algún valor fuera de los dominios se descartan.
+        """
+        indices = [self.indice[x] for x in alcance]
+        posicion = [{valor: a for a, valor in enumerate(self.valores[i])} for i in indices]
+        validas = []
+        for tupla in tuplas:
+            try:
+                validas.append(tuple(p[valor] for p, valor in zip(posicion, tupla)))
+            except KeyError:
+                continue
+        t = len(self.tablas)
+        self.tablas.append(RestriccionTabla(indices, validas, [len(self.valores[i]) for i in indices]))
+        for i in set(indices):
+            self.tablas_de[i].append(t)
+
+    def estado_tablas(self):
+        """Estado compact-table inicial de cada tabla (todas las tuplas válidas)"""
+        return [tabla.estado_inicial for tabla in self.tablas]
+
+    def ac3(self, dominio=None, arcos=None, estado=None, encadenar=True):
+        """
+        AC-3 con cola sin duplicados y soportes residuales (AC-2001).
+
+        Cada arco está en la cola como mucho una vez. Para cada (arco, valor)
+        se recuerda el último soporte encontrado; si sigue en el dominio no
+        hace falta buscar otro. Las tablas entran en la cola por su índice y
+        se propagan con compact-table; `estado` es su lista de estados (se
+        modifica) y, si no se da, se parte de todas las tuplas.
+
+        `arcos` limita la cola inicial: arcos (i, j) e índices de tablas (por
+        defecto, todos). Sin `encadenar` sólo se revisa esa cola inicial, que
+        es lo que hace la comprobación hacia delante. Deja en
+        self.propagaciones las revisiones y en self.eliminados los valores
+        quitados. Devuelve False si algún dominio queda vacío.
+        """
+        dominio = self.dominio if dominio is None else dominio
+        estado = self.estado_tablas() if estado is None else estado
+        if arcos is None:
+            arcos = list(self.soportes) + list(range(len(self.tablas)))
+        else:
+            arcos = list(arcos)
+        cola = deque(arcos)
+        en_cola = set(arcos)
+        residuos = {}
+        self.propagaciones = 0
+        self.eliminados = 0
+
+        def encolar(i, origen):
+            # Tras reducir el dominio de i, revisar lo que depende de i salvo `origen`
+            for k in self.vecinos[i]:
+                if (k, i) != origen and (k, i) not in en_cola:
+                    cola.append((k, i))
+                    en_cola.add((k, i))
+            for t in self.tablas_de[i]:
+                if t != origen and t not in en_cola:
+                    cola.append(t)
+                    en_cola.add(t)
+
+        while cola:
+            arco = cola.popleft()
+            en_cola.discard(arco)
+            if isinstance(arco, int):
+                self.propagaciones += 1
+                resultado = self.tablas[arco].filtrar(dominio, estado[arco])
+                if resultado is None:
+                    return False
+                estado[arco], cambios = resultado
+                for x, quitados in cambios:
+                    self.eliminados += quitados.bit_count()
+                    if encadenar:
+                        encolar(x, arco)
+                continue
+
+            i, j = arco
+            soportes, dj = self.soportes[arco], dominio[j]
+            eliminados = 0
+            di = dominio[i]
+            while di:
+                bit = di & -di
+                di ^= bit
+                a = bit.bit_length() - 1
+                residuo = residuos.get((arco, a))
+                if residuo is not None and dj >> residuo & 1:
+                    continue
+                compatibles = soportes[a] & dj
+                if compatibles:
+                    residuos[(arco, a)] = (compatibles & -compatibles).bit_length() - 1
+                else:
+                    eliminados |= bit
+            self.propagaciones += 1
+
+            if eliminados:
+                self.eliminados += eliminados.bit_count()
+                dominio[i] &= ~eliminados
+                if not dominio[i]:
+                    return False
+                if encadenar:
+                    encolar(i, (j, i))
+        return True
+
+    def mac(self, estadisticas=None):
+        """
+        Vuelta atrás manteniendo consistencia de arco (MAC).
+
+        Se elige la variable con menor dominio, se reduce su dominio al valor
+        probado y AC-3 se ejecuta sólo desde los arcos y tablas que dependen de
+        ella, sobre una copia de los dominios y de los estados de las tablas,
+        de modo que retroceder es descartar la copia. En `estadisticas` se
+        suman los retrocesos y los valores eliminados.
+        Devuelve el diccionario variable -> valor o None.
+        """
+        return self._buscar(True, estadisticas)
+
+    def forward_checking(self, estadisticas=None):
+        """
+        Comprobación hacia delante sobre la red: igual que mac, pero tras cada
+        asignación sólo se revisan una vez los arcos y tablas de la variable
+        asignada, sin propagar en cadena.
+        """
+        return self._buscar(False, estadisticas)
+
+    def _buscar(self, encadenar, estadisticas):
+        retrocesos = eliminados = 0
+        dominio = list(self.dominio)
+        estado = self.estado_tablas()
+        if not all(dominio):
+            # AC-3 sólo detecta los dominios que él mismo vacía
+            registrar(estadisticas, retrocesos=0, propagaciones=0)
+            return None
+        # MAC parte de la red consistente; la comprobación hacia delante filtra
+        # una vez las tablas, así una tabla sin tuplas válidas falla en la raíz
+        arcos = None if encadenar else range(len(self.tablas))
+        if not self.ac3(dominio, arcos, estado, encadenar):
+            registrar(estadisticas, retrocesos=0, propagaciones=self.eliminados)
+            return None
+        eliminados = self.eliminados
+        asignada = bytearray(len(dominio))
+
+        pila = []  # Marcos [dominios y estados antes de asignar, variable, valores por probar]
+        while True:
+            if encadenar:
+                # Con consistencia de arco, dominios unitarios ya son una solución
+                libres = [i for i, d in enumerate(dominio) if d & (d - 1)]
+            else:
+                libres = [i for i in range(len(dominio)) if not asignada[i]]
+            if not libres:
+                registrar(estadisticas, retrocesos=retrocesos, propagaciones=eliminados)
+                return {v: self.valores[i][dominio[i].bit_length() - 1] for i, v in enumerate(self.variables)}
+            i = min(libres, key=lambda i: dominio[i].bit_count())
+            asignada[i] = 1
+            pila.append([dominio, estado, i, dominio[i]])
+
+            while pila:
+                marco = pila[-1]
+                guardado, guardado_estado, i, pendientes = marco
+                if not pendientes:
+                    pila.pop()
+                    asignada[i] = 0
+                    continue
+                bit = pendientes & -pendientes
+                marco[3] = pendientes ^ bit
+                dominio = list(guardado)
+                dominio[i] = bit
+                estado = list(guardado_estado)
+                afectados = [(j, i) for j in self.vecinos[i]] + self.tablas_de[i]
+                consistente = self.ac3(dominio, afectados, estado, encadenar)
+                eliminados += self.eliminados
+                if consistente:
+                    break
+                retrocesos += 1
+            else:
+                registrar(estadisticas, retrocesos=retrocesos, propagaciones=eliminados)
+                return None
+
+    def dominios_actuales(self, dominio=None):
+        """Diccionario variable -> lista de valores que siguen en el dominio"""
+        dominio = self.dominio if dominio is None else dominio
+        return {v: [x for b, x in enumerate(self.valores[i]) if dominio[i] >> b & 1]
+                for i, v in enumerate(self.variables)}
+
+def dsatur(csp, limite=None):
+    """
+    Coloreo voraz DSatur: se colorea primero el vértice con más colores
+    distintos entre sus vecinos (saturación), desempatando por grado, con el
+    menor color libre.
+
+    Los colores vistos por cada vértice se guardan como máscara de bits y los
+    candidatos en un montículo con entradas perezosas; sólo se vuelve a
+    insertar un vecino cuando su saturación sube, así que hay como mucho
+    n + m inserciones y el tiempo es O((n + m) log n).
+
+    Sin `limite` se usan tantos colores como haga falta y el número usado es
+    una cota superior del número cromático. Con `limite`, un vértice sin
+    color libre por debajo del límite toma el que menos vecinos coloreados
+    comparten, lo que da una asignación inicial con pocos conflictos para
+    min_conflicts_bits. Devuelve (arreglo de índices de color, colores usados).
+    """
+    n = len(csp)
+    vecinos, grados = csp.vecinos, csp.grados
+    color = array('i', [-1]) * n
+    vistos = [0] * n  # Máscara de colores entre los vecinos ya coloreados
+    monticulo = [(0, -grados[v], v) for v in range(n)]
+    heapq.heapify(monticulo)
+    usados = 0
+
+    while monticulo:
+        saturacion, _, v = heapq.heappop(monticulo)
+        if color[v] != -1 or -saturacion != vistos[v].bit_count():
+            continue
+        mascara = vistos[v]
+        c = (~mascara & (mascara + 1)).bit_length() - 1  # Menor color libre
+        if limite is not None and c >= limite:
+            choques = [0] * limite
+            for u in vecinos[v]:
+                if 0 <= color[u]:
+                    choques[color[u]] += 1
+            c = min(range(limite), key=choques.__getitem__)
+        color[v] = c
+        usados = max(usados, c + 1)
+        bit = 1 << c
+        for u in vecinos[v]:
+            if color[u] == -1 and not vistos[u] & bit:
+                vistos[u] |= bit
+                heapq.heappush(monticulo, (-vistos[u].bit_count(), -grados[u], u))
+    return color, usados
+
+def min_conflicts_bits(csp, max_pasos=100000, prob_caminata=0.02, tenencia_tabu=0, inicial=None, semilla=None,
+                       estadisticas=None):
+    """
+    Mínimos conflictos con cuentas de conflicto incrementales.
+
+    cuenta[v * k + c] guarda cuántos vecinos de v tienen el color c, así que
+    los conflictos de v son cuenta[v * k + color[v]] y elegir el mejor color
+    cuesta O(k). Cambiar una variable sólo actualiza a sus vecinos. Las
+    variables en conflicto se mantienen en una lista con posiciones para
+    elegir una al azar en O(1). Con probabilidad `prob_caminata` se hace un
+    paso aleatorio, los empates se rompen al azar y, si `tenencia_tabu` > 0,
+    una variable no puede volver a su color anterior durante esos pasos.
+
+    Args:
+        inicial: Arreglo opcional de índices de color para empezar (p. ej. de DSatur)
+        estadisticas: Diccionario opcional donde se suman los pasos y las
+            actualizaciones de cuentas ('propagaciones')
+
+    Devuelve el diccionario nodo -> color o None si se agotan los pasos.
+    """
+    rng = random.Random(semilla)
+    n, k = len(csp), csp.k
+    vecinos = csp.vecinos
+    if inicial is None:
+        color = array('i', (rng.randrange(k) for _ in range(n)))
+    else:
+        color = array('i', inicial)
+    cuenta = array('i', [0]) * (n * k)
+    for v in range(n):
+        for u in vecinos[v]:
+            cuenta[v * k + color[u]] += 1
+
+    en_conflicto = []
+    posicion = array('i', [-1]) * n
+
+    def actualizar(v):
+        conflictivo = cuenta[v * k + color[v]] > 0
+        if conflictivo and posicion[v] == -1:
+            posicion[v] = len(en_conflicto)
+            en_conflicto.append(v)
+        elif not conflictivo and posicion[v] != -1:
+            # Quitar en O(1) moviendo el último elemento a su lugar
+            ultimo = en_conflicto.pop()
+            if ultimo != v:
+                en_conflicto[posicion[v]] = ultimo
+                posicion[ultimo] = posicion[v]
+            posicion[v] = -1
+
+    for v in range(n):
+        actualizar(v)
+
+    tabu_hasta = array('i', [0]) * (n * k)
+    actualizaciones = 0
+
+    for paso in range(max_pasos):
+        if not en_conflicto:
+            registrar(estadisticas, pasos=paso, propagaciones=actualizaciones)
+            return csp.decodificar(color)
+
+        v = en_conflicto[rng.randrange(len(en_conflicto))]
+        anterior = color[v]
+        base = v * k
+
+        if rng.random() < prob_caminata:
+            nuevo = rng.randrange(k)
+        else:
+            mejor, empatados = None, []
+            for c in range(k):
+                if c != anterior and tabu_hasta[base + c] > paso:
+                    continue
+                conflictos = cuenta[base + c]
+                if mejor is None or conflictos < mejor:
+                    mejor, empatados = conflictos, [c]
+                elif conflictos == mejor:
+                    empatados.append(c)
+            if not empatados:
+                continue
+            nuevo = rng.choice(empatados)
+
+        if nuevo == anterior:
+            continue
+
+        color[v] = nuevo
+        tabu_hasta[base + anterior] = paso + 1 + tenencia_tabu
+        actualizaciones += len(vecinos[v])
+        for u in vecinos[v]:
+            cuenta[u * k + anterior] -= 1
+            cuenta[u * k + nuevo] += 1
+            actualizar(u)
+        actualizar(v)
+
+    registrar(estadisticas, pasos=max_pasos, propagaciones=actualizaciones)
+    return csp.decodificar(color) if not en_conflicto else None
+
+def ciclo_corte(csp):
+    """
+    Conjunto de corte de ciclos voraz: se podan repetidamente los vértices de
+    grado <= 1 y, si queda un núcleo con ciclos, se pasa al corte el vértice
+    de mayor grado restante. Devuelve la lista de índices del corte.
+    """
+    n = len(csp)
+    vecinos = csp.vecinos
+    grado = array('i', csp.grados)
+    activo = bytearray([1]) * n
+    corte = []
+    restantes = n
+    monticulo = [(-grado[v], v) for v in range(n)]
+    heapq.heapify(monticulo)
+
+    def quitar(v, pendientes):
+        nonlocal restantes
+        activo[v] = 0
+        restantes -= 1
+        for u in vecinos[v]:
+            if activo[u]:
+                grado[u] -= 1
+                if grado[u] <= 1:
+                    pendientes.append(u)
+                else:
+                    heapq.heappush(monticulo, (-grado[u], u))
+
+    pendientes = [v for v in range(n) if grado[v] <= 1]
+    while restantes:
+        while pendientes:
+            v = pendientes.pop()
+            if activo[v]:
+                quitar(v, pendientes)
+        if not restantes:
+            break
+        # Vértice de mayor grado en el núcleo (entradas obsoletas se descartan)
+        while True:
+            g, v = heapq.heappop(monticulo)
+            if activo[v] and -g == grado[v]:
+                break
+        corte.append(v)
+        quitar(v, pendientes)
+    return corte
+
+def resolver_arbol(csp, corte, valores_corte):
+    """
+    Resuelve el bosque que queda al fijar los colores del corte.
+
+    Para cada árbol se recorre en anchura, se hace consistencia de arco
+    dirigida de las hojas hacia la raíz (un color del padre se elimina si el
+    hijo sólo puede tomar ese color) y luego se asigna de la raíz hacia las
+    hojas, en O(n·d²) en total. Devuelve el arreglo de índices de color o None.
+    """
+    n, k = len(csp), csp.k
+    vecinos = csp.vecinos
+    color = array('i', [-1]) * n
+    for v, c in zip(corte, valores_corte):
+        color[v] = c
+    en_corte = bytearray(n)
+    for v in corte:
+        en_corte[v] = 1
+
+    # Dominios: colores no usados por vecinos del corte
+    dominio = [csp.todos] * n
+    for v in corte:
+        bit = 1 << color[v]
+        for u in vecinos[v]:
+            if en_corte[u]:
+                if color[u] == color[v]:
+                    return None
+            else:
+                dominio[u] &= ~bit
+
+    padre = array('i', [-1]) * n
+    visto = bytearray(en_corte)
+    for raiz in range(n):
+        if visto[raiz]:
+            continue
+        visto[raiz] = 1
+        orden = [raiz]
+        for v in orden:
+            for u in vecinos[v]:
+                if not visto[u]:
+                    visto[u] = 1
+                    padre[u] = v
+                    orden.append(u)
+
+        # Consistencia de arco dirigida, de las hojas hacia la raíz
+        for v in reversed(orden):
+            if not dominio[v]:
+                return None
+            p = padre[v]
+            if p != -1 and dominio[v] & (dominio[v] - 1) == 0:
+                dominio[p] &= ~dominio[v]
+
+        # Asignación sin retroceso, de la raíz hacia las hojas
+        for v in orden:
+            d = dominio[v]
+            if padre[v] != -1:
+                d &= ~(1 << color[padre[v]])
+            if not d:
+                return None
+            color[v] = (d & -d).bit_length() - 1
+    return color
+
+_csp_trabajador = None
+
+def _iniciar_corte(csp, corte):
+    global _csp_trabajador
+    _csp_trabajador = (csp, corte)
+
+def _resolver_bloque(bloque):
+    csp, corte = _csp_trabajador
+    for valores_corte in bloque:
+        color = resolver_arbol(csp, corte, valores_corte)
+        if color is not None:
+            return color
+    return None
+
+def acondicionamiento_corte(csp, procesos=None, tam_bloque=256, estadisticas=None):
+    """
+    Acondicionamiento del corte: elige el corte automáticamente y prueba sus
+    asignaciones con el resolvedor de árboles. Con `procesos`, los bloques de
+    asignaciones se reparten entre procesos y se cancela el resto en cuanto
+    uno encuentra solución. En la versión secuencial, `estadisticas` recibe
+    cuántas asignaciones del corte fallaron ('retrocesos').
+    Devuelve el diccionario nodo -> color o None.
+    """
+    corte = ciclo_corte(csp)
+    asignaciones = itertools.product(range(csp.k), repeat=len(corte))
+
+    if not procesos:
+        for fallidas, valores_corte in enumerate(asignaciones):
+            color = resolver_arbol(csp, corte, valores_corte)
+            if color is not None:
+                registrar(estadisticas, retrocesos=fallidas)
+                return csp.decodificar(color)
+        registrar(estadisticas, retrocesos=csp.k ** len(corte))
+        return None
+
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_corte,
+                             initargs=(csp, corte)) as ejecutor:
+        pendientes = set()
+        agotado = False
+        while True:
+            # Mantener un número acotado de bloques en vuelo
+            while not agotado and len(pendientes) < 2 * procesos:
+                bloque = list(itertools.islice(asignaciones, tam_bloque))
+                if not bloque:
+                    agotado = True
+                    break
+                pendientes.add(ejecutor.submit(_resolver_bloque, bloque))
+            if not pendientes:
+                return None
+            listos, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+            for futuro in listos:
+                color = futuro.result()
+                if color is not None:
+                    for otro in pendientes:
+                        otro.cancel()
+                    return csp.decodificar(color)
+
+def cbj_bits(csp, orden=None, estadisticas=None):
+    """
+    Salto atrás dirigido por conflictos (CBJ) iterativo.
+
+    Usa un solo arreglo de asignación y un mapa variable -> posición en el
+    orden (por defecto, grado decreciente). Cada nivel guarda su conjunto de
+    conflictos con posiciones anteriores; al agotarse un nivel se salta
+    directamente a la posición conflictiva más reciente y se le une el resto
+    del conjunto. `estadisticas` recibe el número de saltos ('retrocesos').
+    Devuelve el diccionario nodo -> color o None.
+    """
+    n = len(csp)
+    saltos = 0
+    if orden is None:
+        orden = sorted(range(n), key=lambda v: -csp.grados[v])
+    posicion = array('i', [0]) * n
+    for i, v in enumerate(orden):
+        posicion[v] = i
+    # Vecinos de cada nivel que aparecen antes en el orden, como posiciones
+    anteriores = [sorted(posicion[u] for u in csp.vecinos[v] if posicion[u] < i)
+                  for i, v in enumerate(orden)]
+
+    valor = array('i', [-1]) * n  # Color del nivel i
+    pendientes = [0] * n          # Colores aún no probados en cada nivel
+    conflictos = [set() for _ in range(n)]
+
+    i = 0
+    if n:
+        pendientes[0] = csp.todos
+    while 0 <= i < n:
+        asignado = False
+        while pendientes[i]:
+            bit = pendientes[i] & -pendientes[i]
+            pendientes[i] ^= bit
+            c = bit.bit_length() - 1
+            # El conflicto con la posición más temprana permite saltos más largos
+            choque = next((j for j in anteriores[i] if valor[j] == c), None)
+            if choque is None:
+                valor[i] = c
+                asignado = True
+                break
+            conflictos[i].add(choque)
+
+        if asignado:
+            i += 1
+            if i < n:
+                pendientes[i] = csp.todos
+                conflictos[i].clear()
+            continue
+
+        # Nivel agotado: saltar a la posición conflictiva más reciente
+        if not conflictos[i]:
+            registrar(estadisticas, retrocesos=saltos)
+            return None
+        saltos += 1
+        h = max(conflictos[i])
+        conflictos[h] |= conflictos[i]
+        conflictos[h].discard(h)
+        for j in range(h, i + 1):
+            valor[j] = -1
+        i = h
+
+    color = array('i', [-1]) * n
+    for j, v in enumerate(orden):
+        color[v] = valor[j]
+    registrar(estadisticas, retrocesos=saltos)
+    return csp.decodificar(color)
+
+def luby(i):
+    """Término i-ésimo (desde 1) de la secuencia de Luby: 1 1 2 1 1 2 4 1 1 2 ..."""
+    while True:
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+        if i == (1 << k) - 1:
+            return 1 << (k - 1)
+        i -= (1 << (k - 1)) - 1
+
+def nogoods_bits(csp, reinicios=True, unidad_reinicio=32, estadisticas=None):
+    """
+    Búsqueda con aprendizaje de nogoods, reinicios de Luby y orden dom/wdeg.
+
+    Un literal v*k + c significa "v tiene el color c". Cada color eliminado de
+    un dominio guarda su razón: el vecino que lo usa o el nogood que lo
+    prohibió. Cuando un dominio se vacía, la unión de esas razones es un
+    conjunto de decisiones incompatibles; se guarda como nogood, se salta
+    atrás hasta la penúltima decisión del conjunto y allí el nogood elimina el
+    valor de la última. Los nogoods se vigilan con dos literales, así que sólo
+    se revisan cuando se asigna uno de ellos, y sobreviven a los reinicios.
+
+    Cada conflicto aumenta el peso de las variables implicadas; se elige la
+    variable con menor |dominio| / peso y se prueba primero su último color
+    (guardado de fase). Con `reinicios`, la búsqueda vuelve a la raíz tras
+    unidad_reinicio * luby(i) conflictos; la secuencia crece sin límite, por
+    lo que el método sigue siendo completo. En `estadisticas` se suman los
+    conflictos ('retrocesos'), los valores podados ('propagaciones') y los
+    reinicios. Devuelve nodo -> color o None.
+    """
+    n, k = len(csp), csp.k
+    vecinos = csp.vecinos
+    valores = array('i', [-1]) * n
+    nivel = array('i', [0]) * n
+    fase = array('i', [-1]) * n
+    dominio = [csp.todos] * n
+    peso = [1] * n
+    razon = array('i', [0]) * (n * k)  # u >= 0: vecino u; -1 - i: nogood i
+    nogoods = []
+    vigilancias = [[] for _ in range(n * k)]  # literal -> nogoods que lo vigilan
+    rastro = []      # Literales eliminados de los dominios
+    decisiones = []  # Variable decidida en cada nivel
+    marcas = []      # Tamaño del rastro al abrir cada nivel
+    # Montículo perezoso de (|dominio| / peso, v); las entradas viejas se descartan al salir
+    monticulo = [(dominio[v].bit_count() / peso[v], v) for v in range(n)]
+    heapq.heapify(monticulo)
+
+    def actualizar(v):
+        heapq.heappush(monticulo, (dominio[v].bit_count() / peso[v], v))
+
+    def quitar(u, c, motivo):
+        nonlocal podados
+        podados += 1
+        dominio[u] &= ~(1 << c)
+        razon[u * k + c] = motivo
+        rastro.append(u * k + c)
+        actualizar(u)
+
+    def propagar(v, c):
+        # Devuelve la variable cuyo dominio quedó vacío, o -1
+        bit = 1 << c
+        for u in vecinos[v]:
+            if valores[u] == -1 and dominio[u] & bit:
+                quitar(u, c, v)
+                if not dominio[u]:
+                    return u
+
+        literal = v * k + c
+        lista = vigilancias[literal]
+        i = 0
+        while i < len(lista):
+            indice = lista[i]
+            nogood = nogoods[indice]
+            if nogood[0] == literal:
+                nogood[0], nogood[1] = nogood[1], nogood[0]
+            w, d = divmod(nogood[0], k)
+            if valores[w] != -1 and valores[w] != d:
+                i += 1  # Ya satisfecho por el otro literal vigilado
+                continue
+            for j in range(2, len(nogood)):
+                x, e = divmod(nogood[j], k)
+                if valores[x] != e:
+                    nogood[1], nogood[j] = nogood[j], nogood[1]
+                    vigilancias[nogood[1]].append(indice)
+                    lista[i] = lista[-1]
+                    lista.pop()
+                    break
+            else:
+                # Todos los demás literales son ciertos: el nogood elimina d de w
+                i += 1
+                if dominio[w] >> d & 1:
+                    quitar(w, d, -1 - indice)
+                    if not dominio[w]:
+                        return w
+        return -1
+
+    def retroceder(hasta):
+        if len(decisiones) <= hasta:
+            return
+        marca = marcas[hasta]
+        del marcas[hasta:]
+        libres = set(decisiones[hasta:])
+        for v in libres:
+            valores[v] = -1
+        del decisiones[hasta:]
+        while len(rastro) > marca:
+            u, c = divmod(rastro.pop(), k)
+            dominio[u] |= 1 << c
+            libres.add(u)
+        for v in libres:
+            actualizar(v)
+
+    def analizar(w):
+        # Aprende el nogood del dominio vacío de w y lo aplica tras saltar atrás.
+        # Devuelve la siguiente variable sin valores, -1 si no hay, o None si no hay solución
+        conjunto = set()
+        for c in range(k):
+            motivo = razon[w * k + c]
+            if motivo >= 0:
+                conjunto.add(motivo * k + c)
+            else:
+                conjunto.update(l for l in nogoods[-1 - motivo] if l != w * k + c)
+        peso[w] += 1
+        actualizar(w)
+        for l in conjunto:
+            peso[l // k] += 1
+            if valores[l // k] == -1:
+                actualizar(l // k)
+        if not conjunto:
+            return None
+
+        aprendido = sorted(conjunto, key=lambda l: -nivel[l // k])
+        ultima = aprendido[0]
+        destino = nivel[aprendido[1] // k] if len(aprendido) > 1 else 0
+        indice = len(nogoods)
+        nogoods.append(aprendido)
+        if len(aprendido) > 1:
+            vigilancias[aprendido[0]].append(indice)
+            vigilancias[aprendido[1]].append(indice)
+        retroceder(destino)
+        v, c = divmod(ultima, k)
+        quitar(v, c, -1 - indice)
+        return v if not dominio[v] else -1
+
+    def seleccionar():
+        while monticulo:
+            p, v = heapq.heappop(monticulo)
+            if valores[v] == -1 and dominio[v].bit_count() / peso[v] == p:
+                return v
+        return None
+
+    conflictos, serie, podados = 0, 1, 0
+    limite = unidad_reinicio
+    while True:
+        v = seleccionar()
+        if v is None:
+            registrar(estadisticas, retrocesos=conflictos, propagaciones=podados, reinicios=serie - 1)
+            return csp.decodificar(valores)
+        c = fase[v]
+        if c == -1 or not dominio[v] >> c & 1:
+            c = (dominio[v] & -dominio[v]).bit_length() - 1
+        marcas.append(len(rastro))
+        decisiones.append(v)
+        valores[v], nivel[v], fase[v] = c, len(decisiones), c
+
+        vacia = propagar(v, c)
+        while vacia != -1:
+            conflictos += 1
+            vacia = analizar(vacia)
+            if vacia is None:
+                registrar(estadisticas, retrocesos=conflictos, propagaciones=podados, reinicios=serie - 1)
+                return None
+
+        if reinicios and conflictos >= limite:
+            retroceder(0)
+            serie += 1
+            limite = conflictos + unidad_reinicio * luby(serie)
+
+def clique_voraz(csp):
+    """Clique maximal construida por grado decreciente; su tamaño es una cota inferior del número cromático"""
+    clique = []
+    candidatos = set(range(len(csp)))
+    while candidatos:
+        v = max(candidatos, key=csp.grados.__getitem__)
+        clique.append(v)
+        candidatos &= set(csp.vecinos[v])
+    return clique
+
+def numero_cromatico(csp, resolvedor=nogoods_bits):
+    """
+    Número cromático del grafo de `csp` (se ignoran sus colores).
+
+    DSatur da la cota superior y una clique voraz la inferior; entre ambas se
+    baja de a un color con un resolvedor completo hasta que no hay solución,
+    así que el resolvedor nunca trabaja con más colores de los necesarios.
+    Devuelve (número de colores, arreglo de índices de color).
+    """
+    mejor, superior = dsatur(csp)
+    inferior = len(clique_voraz(csp))
+    while superior > inferior:
+        reducido = csp.con_colores(superior - 1)
+        solucion = resolvedor(reducido)
+        if solucion is None:
+            break
+        superior -= 1
+        mejor = array('i', (solucion[v] for v in csp.variables))
+    return superior, mejor
+
+# Estrategias disponibles para el portafolio; las completas pueden demostrar que no hay solución
+ESTRATEGIAS = {
+    'backtracking': backtracking_bits,
+    'forward_checking': forward_checking_bits,
+    'cbj': cbj_bits,
+    'nogoods': nogoods_bits,
+    'min_conflicts': min_conflicts_bits,
+}
+COMPLETAS = {'backtracking', 'forward_checking', 'cbj', 'nogoods'}
+
+def _correr_estrategia(nombre, csp, cola):
+    cola.put((nombre, ESTRATEGIAS[nombre](csp)))
+
+def portafolio(csp, estrategias=None, tiempo_limite=None, familia=None, archivo_registro=None):
+    """
+    Lanza varias estrategias en procesos separados sobre la misma instancia,
+    se queda con el primer resultado concluyente y termina las demás.
+
+    Un resultado es concluyente si trae solución o si viene de una estrategia
+    completa (en ese caso None significa que no hay solución); que
+    min_conflicts agote sus pasos no cuenta. Si se da `archivo_registro`, se
+    añade una línea "familia,estrategia,segundos" para ajustar los valores
+    por defecto de cada familia de instancias.
+
+    Devuelve (estrategia ganadora, solución); (None, None) si nadie concluye
+    antes de `tiempo_limite` segundos.
+    """
+    estrategias = list(estrategias or ESTRATEGIAS)
+    cola = multiprocessing.Queue()
+    procesos = [multiprocessing.Process(target=_correr_estrategia, args=(nombre, csp, cola), daemon=True)
+                for nombre in estrategias]
+    inicio = time.perf_counter()
+    for proceso in procesos:
+        proceso.start()
+
+    ganador, solucion = None, None
+    try:
+        for _ in estrategias:
+            restante = None if tiempo_limite is None else max(0.0, tiempo_limite - (time.perf_counter() - inicio))
+            try:
+                nombre, resultado = cola.get(timeout=restante)
+            except queue.Empty:
+                break
+            if resultado is not None or nombre in COMPLETAS:
+                ganador, solucion = nombre, resultado
+                break
+    finally:
+        for proceso in procesos:
+            if proceso.is_alive():
+                proceso.terminate()
+            proceso.join()
+
+    segundos = time.perf_counter() - inicio
+    if ganador and archivo_registro:
+        with open(archivo_registro, 'a', encoding='utf-8') as registro:
+            registro.write(f"{familia or ''},{ganador},{segundos:.6f}\n")
+    return ganador, solucion
+
+def componentes_biconexas(csp):
+    """
+    Bloques (componentes biconexas) del grafo con el algoritmo de Tarjan en
+    versión iterativa. Cada bloque es una lista de índices; los vértices
+    aislados forman un bloque propio.
+    """
+    n = len(csp)
+    vecinos = csp.vecinos
+    descubierto = array('i', [-1]) * n
+    bajo = array('i', [0]) * n
+    bloques = []
+    tiempo = 0
+
+    for raiz in range(n):
+        if descubierto[raiz] != -1:
+            continue
+        if not vecinos[raiz]:
+            bloques.append([raiz])
+            descubierto[raiz] = tiempo
+            tiempo += 1
+            continue
+        descubierto[raiz] = bajo[raiz] = tiempo
+        tiempo += 1
+        aristas = []
+        pila = [(raiz, -1, iter(vecinos[raiz]))]
+        while pila:
+            v, padre, hijos = pila[-1]
+            avanzo = False
+            for u in hijos:
+                if descubierto[u] == -1:
+                    descubierto[u] = bajo[u] = tiempo
+                    tiempo += 1
+                    aristas.append((v, u))
+                    pila.append((u, v, iter(vecinos[u])))
+                    avanzo = True
+                    break
+                if u != padre and descubierto[u] < descubierto[v]:
+                    aristas.append((v, u))
+                    bajo[v] = min(bajo[v], descubierto[u])
+            if avanzo:
+                continue
+            pila.pop()
+            if padre != -1:
+                bajo[padre] = min(bajo[padre], bajo[v])
+                if bajo[v] >= descubierto[padre]:
+                    # padre separa el subárbol de v: cerrar el bloque
+                    bloque = set()
+                    while True:
+                        a, b = aristas.pop()
+                        bloque.add(a)
+                        bloque.add(b)
+                        if (a, b) == (padre, v):
+                            break
+                    bloques.append(sorted(bloque))
+    return bloques
+
+def subproblema(csp, indices):
+    """Problema de coloreo restringido a un subconjunto de variables"""
+    nombres = {i: csp.variables[i] for i in indices}
+    grafo = {nombres[i]: [nombres[j] for j in csp.vecinos[i] if j in nombres] for i in indices}
+    return CSPColoreo(grafo, csp.colores)
+
+def resolver_por_componentes(csp, resolvedor=forward_checking_bits, procesos=None, umbral_paralelo=1000):
+    """
+    Divide el grafo en bloques biconexos (cada componente conexa se parte en
+    uno o más bloques), resuelve cada uno por separado y combina las soluciones.
+
+    Los colores son intercambiables, así que al unir un bloque con un punto
+    de articulación ya coloreado basta con intercambiar dos colores en ese
+    bloque. El costo de búsqueda depende del bloque más grande y no del mapa
+    completo. Con `procesos`, los bloques de al menos `umbral_paralelo`
+    variables se resuelven en paralelo. Devuelve nodo -> color o None.
+    """
+    bloques = componentes_biconexas(csp)
+    subproblemas = [subproblema(csp, b) for b in bloques]
+
+    soluciones = [None] * len(bloques)
+    grandes = [i for i, b in enumerate(bloques) if procesos and len(b) >= umbral_paralelo]
+    if grandes:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            tam_lote = max(1, len(grandes) // (4 * procesos))
+            resultados = ejecutor.map(resolvedor, [subproblemas[i] for i in grandes], chunksize=tam_lote)
+            en_paralelo = set(grandes)
+            for i in range(len(bloques)):
+                if i not in en_paralelo:
+                    soluciones[i] = resolvedor(subproblemas[i])
+            for i, solucion in zip(grandes, resultados):
+                soluciones[i] = solucion
+    else:
+        for i, sub in enumerate(subproblemas):
+            soluciones[i] = resolvedor(sub)
+            if soluciones[i] is None:
+                return None
+    if any(sol is None for sol in soluciones):
+        return None
+
+    # Recorrer el árbol de bloques alineando colores en los puntos de articulación
+    bloques_de = [[] for _ in range(len(csp))]
+    for i, bloque in enumerate(bloques):
+        for v in bloque:
+            bloques_de[v].append(i)
+    final = {}
+    procesado = [False] * len(bloques)
+    for inicio in range(len(bloques)):
+        if procesado[inicio]:
+            continue
+        procesado[inicio] = True
+        final.update(soluciones[inicio])
+        cola = deque([inicio])
+        while cola:
+            b = cola.popleft()
+            for v in bloques[b]:
+                nombre = csp.variables[v]
+                for otro in bloques_de[v]:
+                    if procesado[otro]:
+                        continue
+                    procesado[otro] = True
+                    x, y = soluciones[otro][nombre], final[nombre]
+                    intercambio = {x: y, y: x}
+                    for var, color in soluciones[otro].items():
+                        final[var] = intercambio.get(color, color)
+                    cola.append(otro)
+    return {v: final[v] for v in csp.variables}
+
+def orden_eliminacion(csp):
+    """
+    Orden de eliminación de grado mínimo con relleno. Define implícitamente
+    una descomposición en árbol; devuelve (orden, ancho inducido).
+    """
+    adyacentes = [set(vs) for vs in csp.vecinos]
+    monticulo = [(len(a), v) for v, a in enumerate(adyacentes)]
+    heapq.heapify(monticulo)
+    eliminado = bytearray(len(csp))
+    orden, ancho = [], 0
+    while monticulo:
+        g, v = heapq.heappop(monticulo)
+        if eliminado[v] or g != len(adyacentes[v]):
+            continue
+        eliminado[v] = 1
+        orden.append(v)
+        ancho = max(ancho, g)
+        vecinos = adyacentes[v]
+        for u in vecinos:
+            adyacentes[u].discard(v)
+            adyacentes[u] |= vecinos - {u}
+            heapq.heappush(monticulo, (len(adyacentes[u]), u))
+    return orden, ancho
+
+def _extractor(posiciones):
+    # itemgetter con una sola posición no devuelve tupla
+    if len(posiciones) == 1:
+        i = posiciones[0]
+        return lambda valores: (valores[i],)
+    return itemgetter(*posiciones)
+
+def contar_soluciones(csp):
+    """
+    Cuenta las soluciones con programación dinámica sobre la descomposición
+    en árbol inducida por el orden de eliminación (eliminación de variables).
+
+    Cada factor es (alcance, tabla de cuentas); al eliminar una variable se
+    multiplican los factores que la contienen y se suma sobre sus valores.
+    El tiempo es O(n · k^(ancho + 1)): exponencial en el ancho de árbol y no
+    en el número de variables. Las cuentas son enteros exactos.
+    """
+    k = csp.k
+    orden, _ = orden_eliminacion(csp)
+    factores_de = [[] for _ in range(len(csp))]
+    diferentes = {(a, b): int(a != b) for a in range(k) for b in range(k)}
+    for v in range(len(csp)):
+        for u in csp.vecinos[v]:
+            if v < u:
+                factor = ((v, u), diferentes)
+                factores_de[v].append(factor)
+                factores_de[u].append(factor)
+
+    total = 1
+    for x in orden:
+        factores, factores_de[x] = factores_de[x], []
+        alcance = sorted({y for a, _ in factores for y in a if y != x})
+        # Cada factor lee su clave de la tupla (valores del alcance..., valor de x)
+        posiciones = {y: i for i, y in enumerate(alcance)}
+        posiciones[x] = len(alcance)
+        lectores = [(_extractor([posiciones[y] for y in a]), t) for a, t in factores]
+        tabla = {}
+        for clave in itertools.product(range(k), repeat=len(alcance)):
+            suma = 0
+            for valor_x in range(k):
+                completa = clave + (valor_x,)
+                producto = 1
+                for leer, t in lectores:
+                    producto *= t[leer(completa)]
+                    if not producto:
+                        break
+                suma += producto
+            tabla[clave] = suma
+
+        if not alcance:
+            total *= tabla[()]
+            if not total:
+                return 0
+            continue
+        # Los factores consumidos se sustituyen por el nuevo en las variables restantes
+        nuevo = (tuple(alcance), tabla)
+        usados = {id(f) for f in factores}
+        for y in alcance:
+            factores_de[y] = [f for f in factores_de[y] if id(f) not in usados]
+            factores_de[y].append(nuevo)
+    return total
+
+class CSPIncremental:
+    def __init__(self, grafo, colores, resolvedor=forward_checking_bits, max_pasos_locales=500, prob_caminata=0.05,
+                 radio_max=3, tam_max_region=300, semilla=None):
+        """
+        Coloreo que se mantiene resuelto mientras se agregan y quitan aristas.
+
+        Tras cada cambio se repara la solución anterior en lugar de resolver
+        de nuevo: primero mínimos conflictos local desde la asignación previa,
+        luego vuelta atrás (MAC) sobre una región alrededor de los conflictos
+        con el resto del mapa fijo, y sólo si ambas fallan una búsqueda
+        completa con `resolvedor`. `ultima_reparacion` indica qué nivel hizo
+        falta: 'ninguna', 'min_conflicts', 'region' o 'completa'. Los cambios
+        devuelven sólo si hay solución, para no copiar el mapa en cada uno; la
+        asignación se consulta con `solucion`.
+
+        Args:
+            max_pasos_locales: Pasos de mínimos conflictos antes de pasar a la región
+            radio_max: Distancia máxima a los conflictos de la región liberada
+            tam_max_region: Número máximo de vértices de la región
+        """
+        self.grafo = {v: set() for v in grafo}
+        for v, vecinos in grafo.items():
+            for u in vecinos:
+                if u != v:
+                    self.grafo.setdefault(u, set()).add(v)
+                    self.grafo[v].add(u)
+        self.colores = list(colores)
+        self.k = len(self.colores)
+        self.resolvedor = resolvedor
+        self.max_pasos_locales = max_pasos_locales
+        self.prob_caminata = prob_caminata
+        self.radio_max = radio_max
+        self.tam_max_region = tam_max_region
+        self.rng = random.Random(semilla)
+        self.color = {}  # nodo -> índice de color
+        self.hay_solucion = False
+        self.ultima_reparacion = 'completa'
+        self._resolver_completo()
+
+    @property
+    def solucion(self):
+        """Diccionario nodo -> color actual, o None si el problema no tiene solución"""
+        if not self.hay_solucion:
+            return None
+        return {v: self.colores[c] for v, c in self.color.items()}
+
+    def agregar_restriccion(self, u, v):
+        """Añade la arista u - v (creando los nodos si hace falta) y repara la solución; devuelve si la hay"""
+        for nodo in (u, v):
+            if nodo not in self.grafo:
+                self.grafo[nodo] = set()
+                if self.hay_solucion:
+                    self.color[nodo] = self._mejor_color(nodo)
+        if u == v or v in self.grafo[u]:
+            self.ultima_reparacion = 'ninguna'
+            return self.hay_solucion
+        self.grafo[u].add(v)
+        self.grafo[v].add(u)
+        if not self.hay_solucion:
+            # Agregar restricciones a un problema sin solución no lo arregla
+            self.ultima_reparacion = 'ninguna'
+            return False
+        return self._reparar([x for x in (u, v) if self._en_conflicto(x)])
+
+    def quitar_restriccion(self, u, v):
+        """Quita la arista u - v; la solución anterior sigue valiendo si la había. Devuelve si hay solución"""
+        self.grafo[u].discard(v)
+        self.grafo[v].discard(u)
+        if self.hay_solucion:
+            self.ultima_reparacion = 'ninguna'
+            return True
+        self._resolver_completo()
+        return self.hay_solucion
+
+    def _en_conflicto(self, v):
+        c = self.color[v]
+        return any(self.color[u] == c for u in self.grafo[v])
+
+    def _mejor_color(self, v):
+        # Color que menos vecinos usan, con desempate al azar
+        cuenta = [0] * self.k
+        for u in self.grafo[v]:
+            c = self.color.get(u)
+            if c is not None:
+                cuenta[c] += 1
+        menor = min(cuenta)
+        return self.rng.choice([c for c in range(self.k) if cuenta[c] == menor])
+
+    def _reparar(self, conflictivos):
+        if not conflictivos:
+            self.ultima_reparacion = 'ninguna'
+        elif self._min_conflicts_local(conflictivos):
+            self.ultima_reparacion = 'min_conflicts'
+        elif self._reparar_region(conflictivos):
+            self.ultima_reparacion = 'region'
+        else:
+            self._resolver_completo()
+            return self.hay_solucion
+        return True
+
+    def _min_conflicts_local(self, conflictivos):
+        # Mínimos conflictos que sólo mira a los vecinos de lo que cambia;
+        # si no termina, deshace sus cambios para que la región parta del estado previo
+        pendientes = set(conflictivos)
+        originales = {}
+        for _ in range(self.max_pasos_locales):
+            if not pendientes:
+                return True
+            v = self.rng.choice(tuple(pendientes))
+            if self.rng.random() < self.prob_caminata:
+                nuevo = self.rng.randrange(self.k)
+            else:
+                nuevo = self._mejor_color(v)
+            originales.setdefault(v, self.color[v])
+            self.color[v] = nuevo
+            for x in (v, *self.grafo[v]):
+                if self._en_conflicto(x):
+                    pendientes.add(x)
+                else:
+                    pendientes.discard(x)
+        if not pendientes:
+            return True
+        self.color.update(originales)
+        return False
+
+    def _reparar_region(self, conflictivos):
+        # Libera los vértices a distancia <= radio de los conflictos y resuelve
+        # esa región con MAC, con los colores de los vecinos de fuera fijos
+        for radio in range(1, self.radio_max + 1):
+            region = dict.fromkeys(conflictivos)
+            frontera = list(conflictivos)
+            for _ in range(radio):
+                siguiente = []
+                for v in frontera:
+                    for u in self.grafo[v]:
+                        if u not in region and len(region) < self.tam_max_region:
+                            region[u] = None
+                            siguiente.append(u)
+                frontera = siguiente
+
+            dominios = {}
+            for v in region:
+                fijos = {self.color[u] for u in self.grafo[v] if u not in region}
+                dominios[v] = [c for c in range(self.k) if c not in fijos]
+            red = RedRestricciones(dominios)
+            for v in region:
+                for u in self.grafo[v]:
+                    if u in region and (red.indice[u], red.indice[v]) not in red.soportes:
+                        red.agregar_restriccion(v, u, lambda a, b: a != b)
+            asignacion = red.mac()
+            if asignacion is not None:
+                self.color.update(asignacion)
+                return True
+            if len(region) >= self.tam_max_region:
+                break
+        return False
+
+    def _resolver_completo(self):
+        self.ultima_reparacion = 'completa'
+        resultado = self.resolvedor(CSPColoreo(self.grafo, self.colores))
+        indice = {c: i for i, c in enumerate(self.colores)}
+        self.hay_solucion = resultado is not None
+        self.color = {v: indice[c] for v, c in resultado.items()} if self.hay_solucion else {}
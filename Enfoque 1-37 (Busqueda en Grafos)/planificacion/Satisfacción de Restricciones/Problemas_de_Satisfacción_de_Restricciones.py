@@ -1,3 +1,6 @@
+from Motor_CSP import (CSPColoreo, CSPIncremental, backtracking_bits, numero_cromatico, portafolio,
+                       resolver_por_componentes)
+
 # Diccionario que representa el mapa (grafo) de Australia
 mapa = {
     'WA': ['NT', 'SA'],
@@ -36,10 +39,58 @@ def resolver(region_index=0, regiones=list(mapa.keys())):
             del asignacion[region]  # deshacer si no funciona
     return False
 
-# Ejecutar la búsqueda
-if resolver():
-    print("Solución encontrada:")
-    for region in asignacion:
-        print(f"{region} → {asignacion[region]}")
-else:
-    print("No se encontró solución válida.")
+if __name__ == "__main__":
+    # Ejecutar la búsqueda
+    if resolver():
+        print("Solución encontrada:")
+        for region in asignacion:
+            print(f"{region} → {asignacion[region]}")
+    else:
+        print("No se encontró solución válida.")
+
+    # Misma búsqueda con dominios como máscaras de bits y MRV + grado + LCV
+    resultado = backtracking_bits(CSPColoreo(mapa, colores))
+    if resultado:
+        print("Solución encontrada con el motor de bits:")
+        for region in resultado:
+            print(f"{region} → {resultado[region]}")
+    else:
+        print("No se encontró solución válida con el motor de bits.")
+
+    # Portafolio: varias estrategias compiten en procesos separados
+    ganadora, resultado = portafolio(CSPColoreo(mapa, colores))
+    if resultado:
+        print(f"Solución encontrada por el portafolio (ganó {ganadora}):")
+        for region in resultado:
+            print(f"{region} → {resultado[region]}")
+    else:
+        print("El portafolio no encontró solución válida.")
+
+    # Descomposición en componentes: T sólo se une al resto a través de V
+    resultado = resolver_por_componentes(CSPColoreo(mapa, colores))
+    if resultado:
+        print("Solución encontrada resolviendo cada bloque biconexo por separado:")
+        for region in resultado:
+            print(f"{region} → {resultado[region]}")
+    else:
+        print("No se encontró solución válida por componentes.")
+
+    # Número cromático: DSatur acota por arriba y el resolvedor exacto baja de a un color
+    csp = CSPColoreo(mapa, colores)
+    numero, color = numero_cromatico(csp)
+    print(f"El mapa se puede colorear con {numero} colores:")
+    for region, c in zip(csp.variables, color):
+        print(f"{region} → {csp.colores[c]}")
+
+    # Recoloreo incremental: cada cambio de fronteras repara la solución anterior
+    incremental = CSPIncremental(mapa, colores, semilla=0)
+    for u, v, agregar in (('T', 'SA', True), ('T', 'NSW', True), ('T', 'NSW', False), ('V', 'T', False)):
+        if agregar:
+            hay_solucion = incremental.agregar_restriccion(u, v)
+        else:
+            hay_solucion = incremental.quitar_restriccion(u, v)
+        cambio = f"{'+' if agregar else '-'} {u}-{v}"
+        if hay_solucion:
+            print(f"{cambio}: reparación {incremental.ultima_reparacion} →", incremental.solucion)
+        else:
+            print(f"{cambio}: sin solución")
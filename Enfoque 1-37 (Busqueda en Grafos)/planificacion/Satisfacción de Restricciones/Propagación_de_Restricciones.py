@@ -1,5 +1,7 @@
 from collections import deque
 
+from Motor_CSP import RedRestricciones
+
 # Grafo de adyacencia
 grafo = {
     'A': ['B', 'C'],
@@ -17,24 +19,26 @@ dominios = {nodo: list(colores) for nodo in grafo}
 # AC-3: Arc Consistency Algorithm
 def ac3():
     cola = deque([(xi, xj) for xi in grafo for xj in grafo[xi]])
+    en_cola = set(cola)  # Evita arcos duplicados en la cola
 
     while cola:
         xi, xj = cola.popleft()
+        en_cola.discard((xi, xj))
         if revisar(xi, xj):
             if not dominios[xi]:
                 return False
             for xk in grafo[xi]:
-                if xk != xj:
+                if xk != xj and (xk, xi) not in en_cola:
                     cola.append((xk, xi))
+                    en_cola.add((xk, xi))
     return True
 
 # Revisión de consistencia entre dos nodos
 def revisar(xi, xj):
-    revisado = False
-    for x in dominios[xi][:]:
-        if not any(x != y for y in dominios[xj]):
-            dominios[xi].remove(x)
-            revisado = True
+    consistentes = [x for x in dominios[xi] if any(x != y for y in dominios[xj])]
+    revisado = len(consistentes) < len(dominios[xi])
+    if revisado:
+        dominios[xi] = consistentes
     return revisado
 
 # Asignación de colores si AC-3 encuentra solución
@@ -50,5 +54,43 @@ def asignar_colores():
         else:
             print(f"{nodo} → {dominios[nodo]} (múltiples opciones)")
 
-# Ejecutar
-asignar_colores()
+if __name__ == "__main__":
+    # Ejecutar
+    asignar_colores()
+
+    # Motor con cola sin duplicados y soportes residuales, con restricciones arbitrarias
+    red = RedRestricciones.desde_grafo(grafo, colores)
+    red.agregar_restriccion('A', 'D', lambda a, b: a == b)  # A y D deben compartir color
+    red.dominio[red.indice['A']] = 1 << colores.index('Rojo')  # Fijar A = Rojo
+    if red.ac3():
+        print("Dominios tras AC-3 con soportes residuales (A = Rojo, A == D):")
+        for nodo, valores in red.dominios_actuales().items():
+            print(f"{nodo} → {valores}")
+    else:
+        print("No hay solución posible con AC-3.")
+
+    # Restricciones en extensión (tablas de combinaciones permitidas) con compact-table
+    dias = ['Lunes', 'Martes', 'Miércoles']
+    calendario = RedRestricciones({'Examen1': dias, 'Examen2': dias, 'Examen3': dias})
+    calendario.agregar_tabla(['Examen1', 'Examen2', 'Examen3'],
+                             [('Lunes', 'Martes', 'Miércoles'), ('Martes', 'Lunes', 'Miércoles'),
+                              ('Lunes', 'Miércoles', 'Martes')])
+    calendario.agregar_tabla(['Examen1', 'Examen3'], [('Lunes', 'Miércoles'), ('Martes', 'Lunes')])
+    if calendario.ac3():
+        print("Dominios tras propagar las tablas:")
+        for examen, valores in calendario.dominios_actuales().items():
+            print(f"{examen} → {valores}")
+    solucion = calendario.forward_checking()
+    if solucion:
+        print("Calendario encontrado con comprobación hacia delante:")
+        for examen, dia in solucion.items():
+            print(f"{examen} → {dia}")
+    else:
+        print("No hay calendario que cumpla las tablas.")
+
+    # Una tabla sin combinaciones posibles hace la red insatisfacible desde el inicio
+    imposible = RedRestricciones({'Examen1': dias, 'Examen2': dias})
+    imposible.agregar_tabla(['Examen1', 'Examen2'], [('Lunes', 'Domingo'), ('Sábado', 'Martes')])
+    for nombre, buscar in (("MAC", imposible.mac), ("comprobación hacia delante", imposible.forward_checking)):
+        if buscar() is None:
+            print(f"Sin calendario posible ({nombre}): la tabla no tiene tuplas dentro de los dominios.")
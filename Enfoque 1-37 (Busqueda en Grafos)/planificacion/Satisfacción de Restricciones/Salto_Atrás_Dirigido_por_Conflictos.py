@@ -1,3 +1,5 @@
+from Motor_CSP import CSPColoreo, cbj_bits, nogoods_bits
+
 # Grafo simple para problema de coloreo
 grafo = {
     'A': ['B', 'C'],
@@ -16,7 +18,11 @@ def es_valido(nodo, color, asignacion):
     return True
 
 # Backjumping dirigido por conflictos
-def cbj(nodos, asignacion={}, conflicto={}):
+def cbj(nodos, asignacion=None, conflicto=None):
+    if asignacion is None:
+        asignacion = {}
+    if conflicto is None:
+        conflicto = {}
     if len(asignacion) == len(nodos):
         return asignacion
 
@@ -53,13 +59,34 @@ def siguiente_variable(asignacion, nodos):
         if n not in asignacion:
             return n
 
-# Ejecutar el algoritmo
-nodos = list(grafo.keys())
-resultado = cbj(nodos)
+if __name__ == "__main__":
+    # Ejecutar el algoritmo
+    nodos = list(grafo.keys())
+    resultado = cbj(nodos)
+
+    if resultado:
+        print("Asignación válida encontrada:")
+        for nodo, color in resultado.items():
+            print(f"{nodo} → {color}")
+    else:
+        print("No se encontró una asignación válida.")
+
+    # CBJ con un solo arreglo de asignación y saltos directos al nivel conflictivo
+    resultado = cbj_bits(CSPColoreo(grafo, colores))
+
+    if resultado:
+        print("Asignación válida encontrada con CBJ iterativo:")
+        for nodo, color in resultado.items():
+            print(f"{nodo} → {color}")
+    else:
+        print("No se encontró una asignación válida con CBJ iterativo.")
+
+    # Aprendizaje de nogoods con reinicios de Luby y orden dom/wdeg
+    resultado = nogoods_bits(CSPColoreo(grafo, colores))
 
-if resultado:
-    print("Asignación válida encontrada:")
-    for nodo, color in resultado.items():
-        print(f"{nodo} → {color}")
-else:
-    print("No se encontró una asignación válida.")
+    if resultado:
+        print("Asignación válida encontrada con aprendizaje de nogoods:")
+        for nodo, color in resultado.items():
+            print(f"{nodo} → {color}")
+    else:
+        print("No se encontró una asignación válida con aprendizaje de nogoods.")
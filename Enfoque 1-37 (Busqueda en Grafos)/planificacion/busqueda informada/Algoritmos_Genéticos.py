@@ -1,4 +1,8 @@
 import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
 
 # Grafo representado como diccionario
 grafo = {
@@ -11,84 +15,257 @@ grafo = {
     'G': ['D', 'E', 'F']
 }
 
-inicio = 'A'
-objetivo = 'G'
-tam_poblacion = 6
-max_generaciones = 20
-longitud_max = 6
-prob_mutacion = 0.2
-
-# Generar individuo (camino aleatorio desde el inicio)
-def generar_individuo():
-    camino = [inicio]
-    actual = inicio
-    while actual != objetivo and len(camino) < longitud_max:
-        vecinos = grafo[actual]
-        siguiente = random.choice(vecinos)
-        if siguiente not in camino:  # evitar ciclos
-            camino.append(siguiente)
-            actual = siguiente
-    return camino
-
 # Evaluar individuo (fitness: mientras más corto y llegue a objetivo, mejor)
-def fitness(camino):
+def fitness_camino(camino, objetivo):
     if camino[-1] != objetivo:
         return 0  # penaliza si no llega
     return 1 / len(camino)  # camino más corto tiene mejor fitness
 
-# Cruce entre dos caminos
-def cruzar(p1, p2):
-    punto = random.randint(1, min(len(p1), len(p2)) - 1)
-    hijo = p1[:punto]
-    for nodo in p2:
-        if nodo not in hijo:
-            hijo.append(nodo)
-        if nodo == objetivo:
-            break
-    return hijo
-
-# Mutación: cambiar un nodo del camino
-def mutar(camino):
-    if len(camino) < 2:
+class AlgoritmoGenetico:
+    def __init__(self, grafo, inicio, objetivo, tam_poblacion=6, max_generaciones=20,
+                 longitud_max=6, prob_mutacion=0.2, funcion_fitness=fitness_camino,
+                 islas=1, intervalo_migracion=5, migrantes=1, procesos=None, semilla=None):
+        """
+        Algoritmo genético sobre caminos en un grafo.
+
+        Args:
+            funcion_fitness: función (camino, objetivo) -> valor; debe poder
+                enviarse a otros procesos si se usa `procesos`
+            islas: número de subpoblaciones que evolucionan por separado
+            intervalo_migracion: cada cuántas generaciones migran individuos
+            migrantes: cuántos de los mejores pasan a la isla vecina
+            procesos: si se indica, los individuos nuevos se evalúan en paralelo
+        """
+        self.grafo = grafo
+        self.inicio = inicio
+        self.objetivo = objetivo
+        self.tam_poblacion = tam_poblacion
+        self.max_generaciones = max_generaciones
+        self.longitud_max = longitud_max
+        self.prob_mutacion = prob_mutacion
+        self.funcion_fitness = partial(funcion_fitness, objetivo=objetivo)
+        self.islas = islas
+        self.intervalo_migracion = intervalo_migracion
+        self.migrantes = migrantes
+        self.procesos = procesos
+        self.rng = random.Random(semilla)
+        self.cache_fitness = {}  # tupla del camino -> fitness
+
+    # Generar individuo (camino aleatorio desde el inicio)
+    def generar_individuo(self):
+        camino = [self.inicio]
+        actual = self.inicio
+        while actual != self.objetivo and len(camino) < self.longitud_max:
+            vecinos = self.grafo[actual]
+            siguiente = self.rng.choice(vecinos)
+            if siguiente not in camino:  # evitar ciclos
+                camino.append(siguiente)
+                actual = siguiente
         return camino
-    idx = random.randint(1, len(camino) - 2)
-    vecinos = grafo[camino[idx - 1]]
-    nuevo = random.choice(vecinos)
-    nuevo_camino = camino[:idx] + [nuevo]
-    actual = nuevo
-    while actual != objetivo and len(nuevo_camino) < longitud_max:
-        vecinos = grafo[actual]
-        siguiente = random.choice(vecinos)
-        if siguiente not in nuevo_camino:
-            nuevo_camino.append(siguiente)
-            actual = siguiente
-    return nuevo_camino
-
-# Algoritmo genético
-def algoritmo_genetico():
-    poblacion = [generar_individuo() for _ in range(tam_poblacion)]
-
-    for generacion in range(max_generaciones):
-        poblacion.sort(key=fitness, reverse=True)
-        if fitness(poblacion[0]) > 0:
-            return poblacion[0]
 
+    # Cruce entre dos caminos
+    def cruzar(self, p1, p2):
+        punto = self.rng.randint(1, max(1, min(len(p1), len(p2)) - 1))
+        hijo = p1[:punto]
+        presentes = set(hijo)
+        for nodo in p2:
+            if nodo not in presentes:
+                hijo.append(nodo)
+                presentes.add(nodo)
+            if nodo == self.objetivo:
+                break
+        return hijo
+
+    # Mutación: cambiar un nodo del camino
+    def mutar(self, camino):
+        if len(camino) < 3:
+            return camino
+        idx = self.rng.randint(1, len(camino) - 2)
+        vecinos = self.grafo[camino[idx - 1]]
+        nuevo = self.rng.choice(vecinos)
+        nuevo_camino = camino[:idx] + [nuevo]
+        presentes = set(nuevo_camino)
+        actual = nuevo
+        while actual != self.objetivo and len(nuevo_camino) < self.longitud_max:
+            vecinos = self.grafo[actual]
+            siguiente = self.rng.choice(vecinos)
+            if siguiente not in presentes:
+                nuevo_camino.append(siguiente)
+                presentes.add(siguiente)
+                actual = siguiente
+        return nuevo_camino
+
+    def evaluar(self, poblaciones, ejecutor=None):
+        """Calcula el fitness sólo de los caminos que aún no están en la caché"""
+        pendientes = list({tuple(c) for poblacion in poblaciones for c in poblacion} - self.cache_fitness.keys())
+        if ejecutor and pendientes:
+            tam_lote = max(1, len(pendientes) // (4 * (self.procesos or 1)))
+            valores = ejecutor.map(self.funcion_fitness, pendientes, chunksize=tam_lote)
+        else:
+            valores = map(self.funcion_fitness, pendientes)
+        self.cache_fitness.update(zip(pendientes, valores))
+
+    def fitness(self, camino):
+        return self.cache_fitness[tuple(camino)]
+
+    def siguiente_generacion(self, poblacion):
         nueva_poblacion = poblacion[:2]  # elitismo
 
-        while len(nueva_poblacion) < tam_poblacion:
-            padres = random.sample(poblacion[:4], 2)
-            hijo = cruzar(padres[0], padres[1])
-            if random.random() < prob_mutacion:
-                hijo = mutar(hijo)
+        while len(nueva_poblacion) < self.tam_poblacion:
+            padres = self.rng.sample(poblacion[:4], 2)
+            hijo = self.cruzar(padres[0], padres[1])
+            if self.rng.random() < self.prob_mutacion:
+                hijo = self.mutar(hijo)
             nueva_poblacion.append(hijo)
 
-        poblacion = nueva_poblacion
+        return nueva_poblacion
+
+    def migrar(self, poblaciones):
+        # Topología en anillo: los mejores de cada isla reemplazan a los peores de la siguiente
+        emigrantes = [poblacion[:self.migrantes] for poblacion in poblaciones]
+        for i, poblacion in enumerate(poblaciones):
+            llegan = emigrantes[i - 1]
+            poblacion[len(poblacion) - len(llegan):] = [list(c) for c in llegan]
+            poblacion.sort(key=self.fitness, reverse=True)
+
+    def ejecutar(self):
+        ejecutor = ProcessPoolExecutor(max_workers=self.procesos) if self.procesos else None
+        try:
+            poblaciones = [[self.generar_individuo() for _ in range(self.tam_poblacion)]
+                           for _ in range(self.islas)]
+
+            for generacion in range(self.max_generaciones):
+                self.evaluar(poblaciones, ejecutor)
+                for poblacion in poblaciones:
+                    poblacion.sort(key=self.fitness, reverse=True)
+
+                mejor = max((p[0] for p in poblaciones), key=self.fitness)
+                if self.fitness(mejor) > 0:
+                    return mejor
+
+                if self.islas > 1 and (generacion + 1) % self.intervalo_migracion == 0:
+                    self.migrar(poblaciones)
+
+                poblaciones = [self.siguiente_generacion(p) for p in poblaciones]
+
+            return None
+        finally:
+            if ejecutor:
+                ejecutor.shutdown()
+
+class AlgoritmoGeneticoVectorizado:
+    RELLENO = -1
+
+    def __init__(self, grafo, inicio, objetivo, tam_poblacion=6, max_generaciones=20,
+                 longitud_max=6, prob_mutacion=0.2, semilla=None):
+        """
+        Variante con la población como matriz int32 (tam_poblacion x longitud_max)
+        de índices de nodos, rellena con -1 después del final de cada camino.
+        Selección, cruce, mutación y fitness se aplican a toda la población a la vez.
+        """
+        self.nodos = list(grafo)
+        indice = {n: i for i, n in enumerate(self.nodos)}
+        n = len(self.nodos)
+        grado_max = max(len(v) for v in grafo.values())
+        self.adyacencia = np.zeros((n, n), dtype=bool)
+        self.vecinos = np.zeros((n, grado_max), dtype=np.int32)
+        self.grados = np.zeros(n, dtype=np.int32)
+        for nodo, adyacentes in grafo.items():
+            i = indice[nodo]
+            self.grados[i] = len(adyacentes)
+            for j, vecino in enumerate(adyacentes):
+                self.adyacencia[i, indice[vecino]] = True
+                self.vecinos[i, j] = indice[vecino]
+        self.inicio = indice[inicio]
+        self.objetivo = indice[objetivo]
+        self.tam_poblacion = tam_poblacion
+        self.max_generaciones = max_generaciones
+        self.longitud_max = longitud_max
+        self.prob_mutacion = prob_mutacion
+        self.rng = np.random.default_rng(semilla)
+
+    def vecino_aleatorio(self, nodos):
+        eleccion = (self.rng.random(len(nodos)) * np.maximum(self.grados[nodos], 1)).astype(np.int32)
+        return self.vecinos[nodos, eleccion]
+
+    def recortar(self, poblacion):
+        # Todo lo que sigue a la primera aparición del objetivo (o a un relleno) es relleno
+        fin = np.cumsum((poblacion == self.objetivo) | (poblacion == self.RELLENO), axis=1)
+        despues = np.zeros_like(poblacion, dtype=bool)
+        despues[:, 1:] = fin[:, :-1] > 0
+        poblacion[despues] = self.RELLENO
+        return poblacion
+
+    def generar_poblacion(self):
+        # Caminatas aleatorias desde el inicio, todas las filas a la vez
+        poblacion = np.full((self.tam_poblacion, self.longitud_max), self.RELLENO, dtype=np.int32)
+        poblacion[:, 0] = self.inicio
+        for j in range(1, self.longitud_max):
+            poblacion[:, j] = self.vecino_aleatorio(poblacion[:, j - 1])
+        return self.recortar(poblacion)
+
+    def fitness(self, poblacion):
+        origen, destino = poblacion[:, :-1], poblacion[:, 1:]
+        usadas = destino != self.RELLENO
+        aristas_validas = np.where(usadas, self.adyacencia[origen.clip(0), destino.clip(0)], True).all(axis=1)
+        longitudes = (poblacion != self.RELLENO).sum(axis=1)
+        llega = poblacion[np.arange(len(poblacion)), longitudes - 1] == self.objetivo
+        validos = aristas_validas & llega & (poblacion[:, 0] == self.inicio)
+        return np.where(validos, 1.0 / longitudes, 0.0)
+
+    def siguiente_generacion(self, poblacion, valores):
+        orden = np.argsort(-valores, kind='stable')
+        n_hijos = self.tam_poblacion - 2
+
+        # Selección por torneo binario
+        a, b = self.rng.integers(0, len(poblacion), size=(2, n_hijos, 2))
+        padres = np.where(valores[a] >= valores[b], a, b)
+        p1, p2 = poblacion[padres[:, 0]], poblacion[padres[:, 1]]
+
+        # Cruce de un punto con máscaras
+        puntos = self.rng.integers(1, self.longitud_max, size=n_hijos)
+        mascara = np.arange(self.longitud_max) < puntos[:, None]
+        hijos = np.where(mascara, p1, p2)
+
+        # Mutación: reemplazar un nodo por un vecino aleatorio del anterior
+        mutan = np.flatnonzero(self.rng.random(n_hijos) < self.prob_mutacion)
+        posiciones = self.rng.integers(1, self.longitud_max, size=len(mutan))
+        anteriores = hijos[mutan, posiciones - 1]
+        validas = anteriores != self.RELLENO
+        hijos[mutan[validas], posiciones[validas]] = self.vecino_aleatorio(anteriores[validas])
+
+        return self.recortar(np.concatenate([poblacion[orden[:2]], hijos]))  # elitismo
+
+    def ejecutar(self):
+        poblacion = self.generar_poblacion()
+
+        for generacion in range(self.max_generaciones):
+            valores = self.fitness(poblacion)
+            mejor = int(np.argmax(valores))
+            if valores[mejor] > 0:
+                return [self.nodos[i] for i in poblacion[mejor] if i != self.RELLENO]
+            poblacion = self.siguiente_generacion(poblacion, valores)
+
+        return None
+
+if __name__ == "__main__":
+    # Ejecutar
+    ag = AlgoritmoGenetico(grafo, 'A', 'G', tam_poblacion=6, max_generaciones=20,
+                           longitud_max=6, prob_mutacion=0.2)
+    camino_optimo = ag.ejecutar()
+    if camino_optimo:
+        print("Camino encontrado con algoritmo genético:", " -> ".join(camino_optimo))
+    else:
+        print("No se encontró un camino al objetivo.")
 
-    return None
+    # Modelo de islas con evaluación en paralelo
+    ag = AlgoritmoGenetico(grafo, 'A', 'G', tam_poblacion=6, islas=4, intervalo_migracion=2, procesos=2)
+    camino_optimo = ag.ejecutar()
+    if camino_optimo:
+        print("Camino encontrado con modelo de islas:", " -> ".join(camino_optimo))
 
-# Ejecutar
-camino_optimo = algoritmo_genetico()
-if camino_optimo:
-    print("Camino encontrado con algoritmo genético:", " -> ".join(camino_optimo))
-else:
-    print("No se encontró un camino al objetivo.")
+    # Población vectorizada
+    ag = AlgoritmoGeneticoVectorizado(grafo, 'A', 'G', tam_poblacion=6, max_generaciones=20, longitud_max=6)
+    camino_optimo = ag.ejecutar()
+    if camino_optimo:
+        print("Camino encontrado con población vectorizada:", " -> ".join(camino_optimo))
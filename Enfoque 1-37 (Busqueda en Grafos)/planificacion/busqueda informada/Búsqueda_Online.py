@@ -1,5 +1,8 @@
 from collections import defaultdict, deque
-from typing import List, Dict, Set, Tuple, Optional
+from typing import Callable, List, Dict, Set, Tuple, Optional
+import copy
+import heapq
+import time
 import random
 import math
 
@@ -9,21 +12,30 @@ Accion = str
 ProblemaBusqueda = Dict[Estado, List[Tuple[Accion, Estado, float]]]  # Acción, Estado, Costo
 
 class ProblemaPlanificacionOnline:
-    def __init__(self, estado_inicial: Estado, estados_meta: Set[Estado], acciones: ProblemaBusqueda):
+    def __init__(self, estado_inicial: Estado, estados_meta: Set[Estado], acciones: ProblemaBusqueda,
+                 mundo: Optional[ProblemaBusqueda] = None):
         """
         Inicializa un problema de planificación con búsqueda online
         
         Args:
             estado_inicial: Estado inicial del problema
             estados_meta: Conjunto de estados meta
-            acciones: Diccionario de acciones por estado con costos
+            acciones: Diccionario de acciones por estado con costos (modelo del agente)
+            mundo: Transiciones reales del entorno; si se omite, coinciden con el modelo
         """
         self.estado_inicial = estado_inicial
         self.estados_meta = estados_meta
         self.acciones = acciones
+        self.mundo = mundo if mundo is not None else acciones
         self.estado_actual = estado_inicial
         self.camino = []
         self.costo_acumulado = 0.0
+        # Marcos (estado de origen, costo, acción) de cada acción ejecutada, para deshacer en O(1)
+        self.pila_deshacer: List[Tuple[Estado, float, Accion]] = []
+        # Marcos (estado de destino, costo, acción) deshechos que pueden volver a ejecutarse
+        self.pila_rehacer: List[Tuple[Estado, float, Accion]] = []
+        # Transiciones del modelo corregidas al ejecutar: (estado, acción, destino anterior, destino nuevo)
+        self.transiciones_cambiadas = []
     
     def es_meta(self, estado: Estado) -> bool:
         """Verifica si un estado es estado meta"""
@@ -34,33 +46,51 @@ class ProblemaPlanificacionOnline:
         return self.acciones.get(estado, [])
     
     def ejecutar_accion(self, accion: Accion) -> Tuple[Estado, float]:
-        """Ejecuta una acción y actualiza el estado actual"""
-        for a, s, c in self.acciones.get(self.estado_actual, []):
+        """Ejecuta una acción en el mundo, actualiza el estado actual y corrige el modelo si difiere"""
+        for a, s, c in self.mundo.get(self.estado_actual, []):
             if a == accion:
+                self.actualizar_modelo(self.estado_actual, accion, s, c)
+                self.pila_deshacer.append((self.estado_actual, c, accion))
+                self.pila_rehacer.clear()
                 self.camino.append(accion)
                 self.costo_acumulado += c
                 self.estado_actual = s
                 return s, c
         return self.estado_actual, 0.0  # Si la acción no es aplicable
     
+    def actualizar_modelo(self, estado: Estado, accion: Accion, estado_sig: Estado, costo: float) -> None:
+        """Registra en el modelo la transición observada si no coincide con la esperada"""
+        transiciones = self.acciones.setdefault(estado, [])
+        for i, (a, s, c) in enumerate(transiciones):
+            if a == accion:
+                if (s, c) != (estado_sig, costo):
+                    transiciones[i] = (accion, estado_sig, costo)
+                    self.transiciones_cambiadas.append((estado, accion, s, estado_sig))
+                return
+        transiciones.append((accion, estado_sig, costo))
+        self.transiciones_cambiadas.append((estado, accion, None, estado_sig))
+    
     def retroceder(self, pasos: int = 1) -> Estado:
-        """Retrocede en el camino (simulando replanificación)"""
-        if len(self.camino) >= pasos:
-            # Reconstruir el estado anterior (simplificado)
-            self.camino = self.camino[:-pasos]
-            self.costo_acumulado -= sum(c for _, _, c in self.acciones.get(self.estado_actual, []))
-            self.estado_actual = self.reconstruir_estado(self.estado_inicial, self.camino)
+        """Retrocede en el camino (simulando replanificación), O(1) por paso"""
+        if len(self.pila_deshacer) >= pasos:
+            for _ in range(pasos):
+                estado, costo, accion = self.pila_deshacer.pop()
+                self.pila_rehacer.append((self.estado_actual, costo, accion))
+                self.camino.pop()
+                self.costo_acumulado -= costo
+                self.estado_actual = estado
         return self.estado_actual
     
-    def reconstruir_estado(self, estado_inicial: Estado, camino: List[Accion]) -> Estado:
-        """Reconstruye el estado a partir del camino"""
-        estado = estado_inicial
-        for accion in camino:
-            for a, s, _ in self.acciones.get(estado, []):
-                if a == accion:
-                    estado = s
-                    break
-        return estado
+    def rehacer(self, pasos: int = 1) -> Estado:
+        """Vuelve a ejecutar pasos deshechos con retroceder, O(1) por paso"""
+        if len(self.pila_rehacer) >= pasos:
+            for _ in range(pasos):
+                estado, costo, accion = self.pila_rehacer.pop()
+                self.pila_deshacer.append((self.estado_actual, costo, accion))
+                self.camino.append(accion)
+                self.costo_acumulado += costo
+                self.estado_actual = estado
+        return self.estado_actual
 
 class BusquedaOnline:
     def __init__(self, problema: ProblemaPlanificacionOnline, horizonte: int = 3):
@@ -110,10 +140,10 @@ class BusquedaOnline:
         
         accion = self.plan_actual.pop(0)
         estado_anterior = self.problema.estado_actual
+        esperado = next((s for a, s, c in self.problema.acciones.get(estado_anterior, []) if a == accion), None)
         nuevo_estado, costo = self.problema.ejecutar_accion(accion)
         
         # Verificar si el resultado fue el esperado
-        esperado = next((s for a, s, c in self.problema.acciones.get(estado_anterior, []) if a == accion), None)
         if nuevo_estado != esperado:
             # Replanificar debido a discrepancia
             self.problema.retroceder()
@@ -122,6 +152,254 @@ class BusquedaOnline:
         
         return self.problema.es_meta(nuevo_estado), accion
 
+class BusquedaLRTA(BusquedaOnline):
+    def __init__(self, problema: ProblemaPlanificacionOnline, heuristica: Optional[Callable[[Estado], float]] = None):
+        """
+        LRTA*: mira sólo un paso adelante y aprende H(s) al salir de cada estado,
+        por lo que el trabajo por paso es proporcional al número de acciones
+        
+        Args:
+            problema: Problema de planificación online
+            heuristica: Estimación inicial del costo a la meta (0 si se omite)
+        """
+        super().__init__(problema, horizonte=1)
+        self.heuristica = heuristica or (lambda estado: 0.0)
+        self.H: Dict[Estado, float] = {}  # Heurística aprendida, se conserva entre pasos
+    
+    def valor(self, estado: Estado) -> float:
+        if self.problema.es_meta(estado):
+            return 0.0
+        return self.H.get(estado, self.heuristica(estado))
+    
+    def planificar(self) -> Optional[List[Accion]]:
+        """Elige la acción de menor c + H y actualiza H del estado actual"""
+        estado = self.problema.estado_actual
+        opciones = [(c + self.valor(s), a) for a, s, c in self.problema.acciones_aplicables(estado)]
+        if not opciones:
+            self.plan_actual = []
+        else:
+            mejor_valor, mejor_accion = min(opciones)
+            self.H[estado] = max(self.valor(estado), mejor_valor)
+            self.plan_actual = [mejor_accion]
+        return self.plan_actual.copy()
+    
+    def ejecutar_paso(self) -> Tuple[bool, Optional[Accion]]:
+        if self.problema.es_meta(self.problema.estado_actual):
+            return True, None
+        self.planificar()
+        if not self.plan_actual:
+            return True, None  # Fin (no hay solución)
+        accion = self.plan_actual.pop()
+        nuevo_estado, _ = self.problema.ejecutar_accion(accion)
+        self.problema.transiciones_cambiadas.clear()  # LRTA* usa el modelo corregido directamente
+        return self.problema.es_meta(nuevo_estado), accion
+
+class BusquedaDStarLite(BusquedaOnline):
+    def __init__(self, problema: ProblemaPlanificacionOnline,
+                 heuristica: Optional[Callable[[Estado, Estado], float]] = None):
+        """
+        D* Lite: búsqueda hacia atrás desde las metas que conserva g/rhs entre
+        pasos y sólo repara los estados afectados cuando cambia una transición
+        
+        Args:
+            problema: Problema de planificación online
+            heuristica: Estimación admisible del costo entre dos estados (0 si se omite)
+        """
+        super().__init__(problema, horizonte=0)
+        self.heuristica = heuristica or (lambda a, b: 0.0)
+        self.g: Dict[Estado, float] = defaultdict(lambda: math.inf)
+        self.rhs: Dict[Estado, float] = defaultdict(lambda: math.inf)
+        self.km = 0.0
+        self.cola: List[Tuple[Tuple[float, float], Estado]] = []
+        self.en_cola: Dict[Estado, Tuple[float, float]] = {}
+        self.ultimo = problema.estado_actual
+        
+        # Predecesores según el modelo, para propagar hacia atrás
+        self.predecesores: Dict[Estado, Set[Estado]] = defaultdict(set)
+        for estado, transiciones in problema.acciones.items():
+            for _, s, _ in transiciones:
+                self.predecesores[s].add(estado)
+        
+        for meta in problema.estados_meta:
+            self.rhs[meta] = 0.0
+            self.encolar(meta)
+    
+    def clave(self, estado: Estado) -> Tuple[float, float]:
+        k = min(self.g[estado], self.rhs[estado])
+        return (k + self.heuristica(self.problema.estado_actual, estado) + self.km, k)
+    
+    def encolar(self, estado: Estado) -> None:
+        # Eliminación perezosa: sólo vale la entrada que coincide con en_cola
+        k = self.clave(estado)
+        self.en_cola[estado] = k
+        heapq.heappush(self.cola, (k, estado))
+    
+    def tope(self) -> Tuple[float, float]:
+        while self.cola and self.en_cola.get(self.cola[0][1]) != self.cola[0][0]:
+            heapq.heappop(self.cola)
+        return self.cola[0][0] if self.cola else (math.inf, math.inf)
+    
+    def costo_arista(self, origen: Estado, destino: Estado) -> float:
+        return min((c for _, s, c in self.problema.acciones_aplicables(origen) if s == destino), default=math.inf)
+    
+    def actualizar_vertice(self, estado: Estado) -> None:
+        if not self.problema.es_meta(estado):
+            self.rhs[estado] = min((c + self.g[s] for _, s, c in self.problema.acciones_aplicables(estado)),
+                                   default=math.inf)
+        self.en_cola.pop(estado, None)
+        if self.g[estado] != self.rhs[estado]:
+            self.encolar(estado)
+    
+    def calcular_camino(self) -> None:
+        inicio = self.problema.estado_actual
+        while self.tope() < self.clave(inicio) or self.rhs[inicio] != self.g[inicio]:
+            if not self.cola:
+                break  # Meta inalcanzable desde el estado actual
+            k_anterior, u = heapq.heappop(self.cola)
+            del self.en_cola[u]
+            k_nueva = self.clave(u)
+            if k_anterior < k_nueva:
+                self.encolar(u)
+            elif self.g[u] > self.rhs[u]:
+                self.g[u] = self.rhs[u]
+                for p in self.predecesores[u]:
+                    self.actualizar_vertice(p)
+            else:
+                self.g[u] = math.inf
+                for p in self.predecesores[u] | {u}:
+                    self.actualizar_vertice(p)
+    
+    def reparar(self) -> None:
+        """Incorpora las transiciones que el problema corrigió al ejecutar acciones"""
+        if not self.problema.transiciones_cambiadas:
+            return
+        actual = self.problema.estado_actual
+        self.km += self.heuristica(self.ultimo, actual)
+        self.ultimo = actual
+        for estado, _, destino_anterior, destino_nuevo in self.problema.transiciones_cambiadas:
+            if destino_anterior is not None and math.isinf(self.costo_arista(estado, destino_anterior)):
+                self.predecesores[destino_anterior].discard(estado)
+            self.predecesores[destino_nuevo].add(estado)
+            self.actualizar_vertice(estado)
+        self.problema.transiciones_cambiadas.clear()
+    
+    def mejor_accion(self, estado: Estado) -> Optional[Tuple[Accion, Estado]]:
+        opciones = [(c + self.g[s], a, s) for a, s, c in self.problema.acciones_aplicables(estado)]
+        if not opciones:
+            return None
+        valor, a, s = min(opciones)
+        return None if math.isinf(valor) else (a, s)
+    
+    def planificar(self) -> Optional[List[Accion]]:
+        """Repara la búsqueda y extrae el plan siguiendo el gradiente de g"""
+        self.reparar()
+        self.calcular_camino()
+        plan = []
+        estado = self.problema.estado_actual
+        visitados = {estado}
+        while not self.problema.es_meta(estado):
+            paso = self.mejor_accion(estado)
+            if paso is None or paso[1] in visitados:
+                break
+            plan.append(paso[0])
+            estado = paso[1]
+            visitados.add(estado)
+        self.plan_actual = plan
+        return self.plan_actual.copy()
+    
+    def ejecutar_paso(self) -> Tuple[bool, Optional[Accion]]:
+        if self.problema.es_meta(self.problema.estado_actual):
+            return True, None
+        self.planificar()
+        if not self.plan_actual:
+            return True, None  # Fin (no hay solución)
+        accion = self.plan_actual.pop(0)
+        nuevo_estado, _ = self.problema.ejecutar_accion(accion)
+        return self.problema.es_meta(nuevo_estado), accion
+
+class BusquedaTiempoReal(BusquedaOnline):
+    def __init__(self, problema: ProblemaPlanificacionOnline, presupuesto_ms: float = 5.0,
+                 heuristica: Optional[Callable[[Estado], float]] = None):
+        """
+        Búsqueda en tiempo real: cada paso expande la anticipación primero-el-mejor
+        hasta agotar su presupuesto y se compromete con la primera acción del
+        mejor nodo de la frontera
+        
+        Args:
+            problema: Problema de planificación online
+            presupuesto_ms: Tiempo máximo de planificación por paso, en milisegundos
+            heuristica: Estimación inicial del costo a la meta (0 si se omite)
+        """
+        super().__init__(problema, horizonte=0)
+        self.presupuesto_ms = presupuesto_ms
+        self.heuristica = heuristica or (lambda estado: 0.0)
+        self.H: Dict[Estado, float] = {}  # Heurística aprendida para no quedar en ciclos
+        self.latencias_ms: List[float] = []
+    
+    def valor(self, estado: Estado) -> float:
+        if self.problema.es_meta(estado):
+            return 0.0
+        return self.H.get(estado, self.heuristica(estado))
+    
+    def planificar(self, presupuesto_ms: Optional[float] = None) -> Optional[List[Accion]]:
+        """Expande primero-el-mejor (f = g + H) hasta el plazo y devuelve la primera acción"""
+        presupuesto = self.presupuesto_ms if presupuesto_ms is None else presupuesto_ms
+        plazo = time.perf_counter() + presupuesto / 1000.0
+        inicio = self.problema.estado_actual
+        
+        frontera = []  # (f, desempate, g, estado, primera acción)
+        contador = 0
+        mejor_g = {inicio: 0.0}
+        for accion, s, c in self.problema.acciones_aplicables(inicio):
+            if c < mejor_g.get(s, math.inf):
+                mejor_g[s] = c
+                heapq.heappush(frontera, (c + self.valor(s), contador, c, s, accion))
+                contador += 1
+        
+        while frontera and time.perf_counter() < plazo:
+            f, _, g, estado, primera = frontera[0]
+            if self.problema.es_meta(estado):
+                break  # El mejor nodo ya es meta: no hay nada mejor que expandir
+            heapq.heappop(frontera)
+            if g > mejor_g[estado]:
+                continue
+            for _, s, c in self.problema.acciones_aplicables(estado):
+                if g + c < mejor_g.get(s, math.inf):
+                    mejor_g[s] = g + c
+                    heapq.heappush(frontera, (g + c + self.valor(s), contador, g + c, s, primera))
+                    contador += 1
+        
+        # Descartar entradas obsoletas antes de elegir el mejor nodo de la frontera
+        while frontera and frontera[0][2] > mejor_g[frontera[0][3]]:
+            heapq.heappop(frontera)
+        if not frontera:
+            self.plan_actual = []
+        else:
+            f, _, _, _, primera = frontera[0]
+            self.H[inicio] = max(self.valor(inicio), f)
+            self.plan_actual = [primera]
+        return self.plan_actual.copy()
+    
+    def ejecutar_paso(self, presupuesto_ms: Optional[float] = None) -> Tuple[bool, Optional[Accion]]:
+        if self.problema.es_meta(self.problema.estado_actual):
+            return True, None
+        t0 = time.perf_counter()
+        self.planificar(presupuesto_ms)
+        self.latencias_ms.append((time.perf_counter() - t0) * 1000.0)
+        if not self.plan_actual:
+            return True, None  # Fin (no hay solución)
+        accion = self.plan_actual.pop()
+        nuevo_estado, _ = self.problema.ejecutar_accion(accion)
+        self.problema.transiciones_cambiadas.clear()
+        return self.problema.es_meta(nuevo_estado), accion
+    
+    def percentiles_latencia(self, percentiles: Tuple[float, ...] = (50, 90, 99)) -> Dict[float, float]:
+        """Percentiles (por rango más cercano) de la latencia de planificación por paso, en ms"""
+        if not self.latencias_ms:
+            return {}
+        ordenadas = sorted(self.latencias_ms)
+        return {p: ordenadas[max(0, math.ceil(p / 100 * len(ordenadas)) - 1)] for p in percentiles}
+
 # Ejemplo: Mundo del Robot con incertidumbre
 def crear_problema_robot_online() -> ProblemaPlanificacionOnline:
     """
@@ -142,26 +420,28 @@ def crear_problema_robot_online() -> ProblemaPlanificacionOnline:
         'I': [('mover_arriba', 'F', 1.0), ('mover_izq', 'H', 0.8)]
     }
     
-    # Añadir incertidumbre (10% de probabilidad de fallo)
-    for estado in list(acciones.keys()):
-        for i, (accion, estado_sig, costo) in enumerate(acciones[estado]):
+    # Añadir incertidumbre (10% de probabilidad de fallo): el mundo real difiere
+    # del modelo del agente y las diferencias se descubren al ejecutar
+    mundo = copy.deepcopy(acciones)
+    for estado in list(mundo.keys()):
+        for i, (accion, estado_sig, costo) in enumerate(mundo[estado]):
             if random.random() < 0.1:  # 10% de fallo
-                estados_posibles = [s for s in acciones.keys() if s != estado_sig]
+                estados_posibles = [s for s in mundo.keys() if s != estado_sig]
                 if estados_posibles:
                     estado_fallo = random.choice(estados_posibles)
-                    acciones[estado][i] = (accion, estado_fallo, costo * 1.5)
+                    mundo[estado][i] = (accion, estado_fallo, costo * 1.5)
     
     estado_inicial = 'A'
     estados_meta = {'I'}
     
-    return ProblemaPlanificacionOnline(estado_inicial, estados_meta, acciones)
+    return ProblemaPlanificacionOnline(estado_inicial, estados_meta, acciones, mundo)
 
-def simulacion_online():
+def simulacion_online(crear_buscador=lambda problema: BusquedaOnline(problema, horizonte=4)):
     """Simula la ejecución de búsqueda online"""
     problema = crear_problema_robot_online()
-    buscador = BusquedaOnline(problema, horizonte=4)
+    buscador = crear_buscador(problema)
     
-    print("=== Simulación de Búsqueda Online ===")
+    print(f"=== Simulación de Búsqueda Online ({type(buscador).__name__}) ===")
     print(f"Estado inicial: {problema.estado_actual}")
     print(f"Meta: {problema.estados_meta}")
     print(f"Horizonte de planificación: {buscador.horizonte}")
@@ -191,9 +471,15 @@ def simulacion_online():
         print("\n¡Meta alcanzada!")
         print(f"Camino final: {problema.camino}")
         print(f"Costo total: {problema.costo_acumulado:.2f}")
+        if isinstance(buscador, BusquedaTiempoReal):
+            latencias = buscador.percentiles_latencia()
+            print("Latencia por paso (ms): " + ", ".join(f"p{p}={v:.3f}" for p, v in latencias.items()))
     else:
         print("\nNo se pudo alcanzar la meta")
 
 if __name__ == "__main__":
     # Ejecutar simulación
-    simulacion_online()
\ No newline at end of file
+    simulacion_online()
+    simulacion_online(BusquedaLRTA)
+    simulacion_online(BusquedaDStarLite)
+    simulacion_online(lambda problema: BusquedaTiempoReal(problema, presupuesto_ms=1.0))
\ No newline at end of file
@@ -1,4 +1,6 @@
 import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 # Definimos un grafo simple como diccionario de adyacencia con costos heurísticos
 grafo = {
@@ -22,42 +24,86 @@ heuristica = {
     'G': 0  # Objetivo
 }
 
-def busqueda_tabu(inicio, objetivo, max_iteraciones=10, tamanio_tabu=3):
+def busqueda_tabu(inicio, objetivo, max_iteraciones=10, tamanio_tabu=3, peso_frecuencia=0.0, semilla=None,
+                  pasos_aleatorios=0):
+    # Con `semilla` los empates se rompen al azar; sin ella gana el primer mínimo.
+    # Los primeros `pasos_aleatorios` movimientos van a un vecino permitido al azar
+    # (diversificación para arrancar desde zonas distintas)
+    rng = random.Random(semilla)
     actual = inicio
     mejor_solucion = [actual]
     mejor_heuristica = heuristica[actual]
-    lista_tabu = []
+    # Lista tabú como marcas de iteración: un nodo es tabú mientras i < tabu_hasta[nodo]
+    tabu_hasta = {}
+    # Memoria de largo plazo: cuántas veces se ha visitado cada nodo
+    frecuencia = {actual: 1}
 
     for i in range(max_iteraciones):
         vecinos = grafo.get(actual, [])
         if not vecinos:
             break
 
-        # Filtrar vecinos que no están en la lista tabú
-        candidatos = [(nodo, heuristica[nodo]) for nodo, _ in vecinos if nodo not in lista_tabu]
+        # Filtrar vecinos tabú, salvo que mejoren la mejor heurística vista (aspiración)
+        candidatos = [
+            (heuristica[nodo] + peso_frecuencia * frecuencia.get(nodo, 0), nodo)
+            for nodo, _ in vecinos
+            if tabu_hasta.get(nodo, 0) <= i or heuristica[nodo] < mejor_heuristica
+        ]
 
         if not candidatos:
             break  # Si no hay candidatos válidos, se detiene
 
-        # Elegir el vecino con mejor (menor) heurística
-        siguiente, h = min(candidatos, key=lambda x: x[1])
+        if i < pasos_aleatorios:
+            _, siguiente = rng.choice(candidatos)
+        else:
+            # Elegir el vecino con mejor (menor) heurística penalizada por frecuencia
+            valor_minimo = min(valor for valor, _ in candidatos)
+            empatados = [nodo for valor, nodo in candidatos if valor == valor_minimo]
+            siguiente = empatados[0] if semilla is None else rng.choice(empatados)
 
         # Actualizar la lista tabú
-        lista_tabu.append(actual)
-        if len(lista_tabu) > tamanio_tabu:
-            lista_tabu.pop(0)
+        tabu_hasta[actual] = i + 1 + tamanio_tabu
 
         # Actualizar estado
         actual = siguiente
         mejor_solucion.append(actual)
-        mejor_heuristica = h
+        frecuencia[actual] = frecuencia.get(actual, 0) + 1
+        mejor_heuristica = min(mejor_heuristica, heuristica[actual])
 
         if actual == objetivo:
             break
 
     return mejor_solucion
 
-# Ejecutar la búsqueda Tabú
-camino = busqueda_tabu('A', 'G', max_iteraciones=10, tamanio_tabu=3)
-print("Camino encontrado con Búsqueda Tabú:", " -> ".join(camino))
+def costo_camino(camino):
+    return sum(dict(grafo[n])[m] for n, m in zip(camino, camino[1:]))
 
+def _arranque(arranque, inicio, objetivo, opciones):
+    semilla, pasos_aleatorios = arranque
+    return busqueda_tabu(inicio, objetivo, semilla=semilla, pasos_aleatorios=pasos_aleatorios, **opciones)
+
+def busqueda_tabu_multiarranque(inicio, objetivo, arranques=8, procesos=None, semilla=None,
+                                max_pasos_aleatorios=3, **opciones):
+    """
+    Ejecuta varias búsquedas tabú en paralelo y devuelve el mejor camino.
+
+    El primer arranque es la búsqueda normal; cada uno de los demás empieza
+    con una caminata aleatoria propia de 1 a `max_pasos_aleatorios` pasos,
+    para que no repitan todos la misma trayectoria; con 0 no hay caminata.
+    """
+    rng = random.Random(semilla)
+    configuraciones = [(rng.random(), 0 if j == 0 or max_pasos_aleatorios < 1 else rng.randint(1, max_pasos_aleatorios))
+                       for j in range(arranques)]
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        caminos = list(ejecutor.map(partial(_arranque, inicio=inicio, objetivo=objetivo, opciones=opciones), configuraciones))
+    validos = [c for c in caminos if c[-1] == objetivo]
+    return min(validos, key=costo_camino) if validos else None
+
+if __name__ == "__main__":
+    # Ejecutar la búsqueda Tabú
+    camino = busqueda_tabu('A', 'G', max_iteraciones=10, tamanio_tabu=3)
+    print("Camino encontrado con Búsqueda Tabú:", " -> ".join(camino))
+
+    camino = busqueda_tabu_multiarranque('A', 'G', arranques=4, max_iteraciones=10, tamanio_tabu=3, peso_frecuencia=0.5)
+    if camino:
+        print("Camino encontrado con Búsqueda Tabú multiarranque:", " -> ".join(camino))
@@ -1,3 +1,10 @@
+import math
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 # Grafo con vecinos y heurísticas (valor estimado al objetivo)
 grafo = {
     'A': [('B', 3), ('C', 4)],
@@ -18,27 +25,96 @@ heuristica = {
     'F': 6
 }
 
-def ascension_colinas(inicio):
+def ascension_colinas(inicio, modo='empinada', max_laterales=0, rng=random):
+    """
+    Ascensión de colinas desde `inicio`.
+
+    modo='empinada' elige el mejor vecino; modo='primera' revisa los vecinos
+    en orden aleatorio y toma el primero que mejora (útil con vecindarios
+    enormes). Se permiten hasta `max_laterales` movimientos a vecinos con la
+    misma heurística para cruzar mesetas.
+    """
     actual = inicio
     camino = [actual]
+    laterales = 0
 
     while True:
         vecinos = grafo.get(actual, [])
         if not vecinos:
             break
 
-        # Elegir el vecino con mejor heurística (más baja)
-        mejor_vecino = min(vecinos, key=lambda x: heuristica[x[0]])
-        
-        if heuristica[mejor_vecino[0]] < heuristica[actual]:
-            actual = mejor_vecino[0]
+        if modo == 'primera':
+            # Muestrear vecinos hasta encontrar uno que mejore
+            candidato = None
+            for vecino, _ in rng.sample(vecinos, len(vecinos)):
+                if heuristica[vecino] < heuristica[actual]:
+                    candidato = vecino
+                    break
+                if candidato is None and heuristica[vecino] == heuristica[actual]:
+                    candidato = vecino
+        else:
+            # Elegir el vecino con mejor heurística (más baja)
+            candidato = min(vecinos, key=lambda x: heuristica[x[0]])[0]
+
+        if candidato is not None and heuristica[candidato] < heuristica[actual]:
+            actual = candidato
+            camino.append(actual)
+            laterales = 0
+        elif candidato is not None and heuristica[candidato] == heuristica[actual] and laterales < max_laterales:
+            # Movimiento lateral sobre una meseta
+            actual = candidato
             camino.append(actual)
+            laterales += 1
         else:
             # No hay mejor vecino (óptimo local)
             break
 
     return camino
 
-# Ejecutar
-camino_resultado = ascension_colinas('A')
-print("Camino encontrado con ascensión de colinas:", " -> ".join(camino_resultado))
+_mejor_compartido = None
+
+def _iniciar_trabajador(mejor):
+    global _mejor_compartido
+    _mejor_compartido = mejor
+
+def _ejecutar_reinicios(semilla, reinicios, meta, opciones):
+    rng = random.Random(semilla)
+    mejor_camino = None
+    for _ in range(reinicios):
+        # Otro proceso ya alcanzó la meta: no vale la pena seguir
+        if _mejor_compartido.value <= meta:
+            break
+        camino = ascension_colinas(rng.choice(list(grafo)), rng=rng, **opciones)
+        if mejor_camino is None or heuristica[camino[-1]] < heuristica[mejor_camino[-1]]:
+            mejor_camino = camino
+        with _mejor_compartido.get_lock():
+            if heuristica[camino[-1]] < _mejor_compartido.value:
+                _mejor_compartido.value = heuristica[camino[-1]]
+    return mejor_camino
+
+def ascension_colinas_reinicios(reinicios=16, procesos=None, meta=0, semilla=None, **opciones):
+    """
+    Reinicios aleatorios repartidos entre procesos que comparten el mejor
+    valor encontrado; todos se detienen en cuanto alguno alcanza `meta`.
+    Sin `procesos` se usa un proceso por CPU, nunca más que reinicios.
+    """
+    mejor = multiprocessing.Value('d', math.inf)
+    rng = random.Random(semilla)
+    procesos = max(1, min(procesos or os.cpu_count() or 1, reinicios))
+    semillas = [rng.random() for _ in range(procesos)]
+    por_proceso = [reinicios // procesos + (i < reinicios % procesos) for i in range(procesos)]
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador, initargs=(mejor,)) as ejecutor:
+        caminos = ejecutor.map(partial(_ejecutar_reinicios, meta=meta, opciones=opciones), semillas, por_proceso)
+        caminos = [c for c in caminos if c]
+    return min(caminos, key=lambda c: heuristica[c[-1]]) if caminos else None
+
+if __name__ == "__main__":
+    # Ejecutar
+    camino_resultado = ascension_colinas('A')
+    print("Camino encontrado con ascensión de colinas:", " -> ".join(camino_resultado))
+
+    camino_resultado = ascension_colinas('A', modo='primera', max_laterales=2)
+    print("Camino encontrado con primera elección:", " -> ".join(camino_resultado))
+
+    camino_resultado = ascension_colinas_reinicios(reinicios=8, procesos=2)
+    print("Camino encontrado con reinicios aleatorios:", " -> ".join(camino_resultado))
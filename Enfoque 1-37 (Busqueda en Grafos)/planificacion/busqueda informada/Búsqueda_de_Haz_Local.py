@@ -25,26 +25,51 @@ heuristica = {
 def obtener_vecinos(nodo):
     return grafo.get(nodo, [])
 
-def evaluar_camino(camino):
-    return heuristica[camino[-1]]
+def evaluar_estado(estado):
+    return heuristica[estado]
+
+def reconstruir_camino(indice, estados, padres):
+    camino = []
+    while indice != -1:
+        camino.append(estados[indice])
+        indice = padres[indice]
+    return camino[::-1]
 
 def busqueda_haz_local(inicio, objetivo, k=2, max_iter=20):
-    haz = [[inicio]]  # Lista de caminos actuales
+    # Cada nodo generado guarda su estado y el índice de su padre,
+    # así no se copian caminos completos en cada expansión
+    estados = [inicio]
+    padres = [-1]
+    haz = [0]  # Índices de los nodos actuales
+    candidatos = {}  # Se reutiliza en cada iteración: estado -> (puntaje, índice del padre)
 
     for _ in range(max_iter):
-        todos_los_vecinos = []
+        candidatos.clear()
 
-        for camino in haz:
-            ultimo = camino[-1]
+        for indice in haz:
+            ultimo = estados[indice]
             if ultimo == objetivo:
-                return camino
+                return reconstruir_camino(indice, estados, padres)
 
             for vecino, _ in obtener_vecinos(ultimo):
-                nuevo_camino = camino + [vecino]
-                heapq.heappush(todos_los_vecinos, (evaluar_camino(nuevo_camino), nuevo_camino))
+                # Eliminar duplicados: un solo candidato por estado final
+                if vecino not in candidatos:
+                    candidatos[vecino] = (evaluar_estado(vecino), indice)
+
+        if not candidatos:
+            break
+
+        # Elegimos los k mejores estados sin ordenar todos los candidatos
+        mejores = heapq.nsmallest(k, candidatos.items(), key=lambda x: x[1][0])
+        haz = []
+        for vecino, (_, padre) in mejores:
+            haz.append(len(estados))
+            estados.append(vecino)
+            padres.append(padre)
 
-        # Elegimos los k mejores caminos basados en heurística
-        haz = [heapq.heappop(todos_los_vecinos)[1] for _ in range(min(k, len(todos_los_vecinos)))]
+    for indice in haz:
+        if estados[indice] == objetivo:
+            return reconstruir_camino(indice, estados, padres)
 
     return None
 
@@ -1,5 +1,9 @@
 import math
 import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
 
 # Grafo como diccionario de adyacencia con costos
 grafo = {
@@ -59,6 +63,99 @@ def temple_simulado(inicio, objetivo, temperatura_inicial=1000, enfriamiento=0.9
 
     return camino
 
-# Ejecutar búsqueda
-camino = temple_simulado('A', 'G')
-print("Camino encontrado con Temple Simulado:", " -> ".join(camino))
+# Esquemas de enfriamiento para el modo vectorizado: reciben las temperaturas
+# actuales de todas las cadenas y devuelven las del siguiente paso
+def enfriamiento_geometrico(t, t0, paso, aceptadas, alfa=0.95):
+    return t * alfa
+
+def enfriamiento_logaritmico(t, t0, paso, aceptadas):
+    return np.full_like(t, t0 / math.log(paso + 2))
+
+def enfriamiento_adaptativo(t, t0, paso, aceptadas, alfa=0.95, paciencia=10, factor=0.5):
+    # Recalienta las cadenas que llevan `paciencia` pasos sin aceptar movimientos
+    t = t * alfa
+    atascadas = aceptadas >= paciencia
+    t[atascadas] = t0 * factor
+    aceptadas[atascadas] = 0
+    return t
+
+def grafo_a_arreglos():
+    """Convierte el grafo a arreglos: índices de nodos, vecinos y pesos con relleno, grados y heurística"""
+    nodos = list(grafo)
+    indice = {n: i for i, n in enumerate(nodos)}
+    grado_max = max(1, max(len(v) for v in grafo.values()))
+    vecinos = np.zeros((len(nodos), grado_max), dtype=np.int32)
+    pesos = np.zeros((len(nodos), grado_max), dtype=np.float64)
+    grados = np.zeros(len(nodos), dtype=np.int32)
+    for n, adyacentes in grafo.items():
+        grados[indice[n]] = len(adyacentes)
+        for j, (m, p) in enumerate(adyacentes):
+            vecinos[indice[n], j] = indice[m]
+            pesos[indice[n], j] = p
+    h = np.array([costo(n) for n in nodos], dtype=np.float64)
+    return nodos, indice, vecinos, pesos, grados, h
+
+def temple_simulado_vectorizado(inicio, objetivo, cadenas=256, temperatura_inicial=1000,
+                                iteraciones=100, enfriamiento=enfriamiento_geometrico, semilla=None):
+    """
+    Ejecuta muchas cadenas independientes a la vez sobre arreglos de numpy.
+
+    Devuelve el mejor camino encontrado y su costo (suma de los costos de
+    las aristas si llega al objetivo, infinito en caso contrario).
+    """
+    rng = np.random.default_rng(semilla)
+    nodos, indice, vecinos, pesos, grados, h = grafo_a_arreglos()
+    meta = indice[objetivo]
+
+    actual = np.full(cadenas, indice[inicio], dtype=np.int32)
+    t = np.full(cadenas, float(temperatura_inicial))
+    sin_aceptar = np.zeros(cadenas, dtype=np.int32)
+    historia = np.empty((iteraciones + 1, cadenas), dtype=np.int32)
+    historia[0] = actual
+    longitudes = np.ones(cadenas, dtype=np.int32)
+    acumulado = np.zeros(cadenas)
+
+    for paso in range(iteraciones):
+        activas = (actual != meta) & (grados[actual] > 0)
+        if not activas.any():
+            break
+
+        # Un vecino aleatorio por cadena y la probabilidad de aceptarlo
+        eleccion = (rng.random(cadenas) * np.maximum(grados[actual], 1)).astype(np.int32)
+        siguiente = vecinos[actual, eleccion]
+        delta = h[actual] - h[siguiente]
+        with np.errstate(over='ignore', divide='ignore'):
+            prob = np.exp(np.minimum(delta, 0) / t)
+        acepta = activas & ((delta > 0) | (rng.random(cadenas) < prob))
+
+        acumulado += np.where(acepta, pesos[actual, eleccion], 0.0)
+        actual = np.where(acepta, siguiente, actual)
+        historia[longitudes[acepta], np.flatnonzero(acepta)] = actual[acepta]
+        longitudes += acepta
+        sin_aceptar = np.where(acepta, 0, sin_aceptar + activas)
+        t = enfriamiento(t, temperatura_inicial, paso, sin_aceptar)
+
+    llegaron = actual == meta
+    costos = np.where(llegaron, acumulado, np.inf)
+    mejor = int(np.argmin(costos)) if llegaron.any() else int(np.argmin(h[actual]))
+    camino = [nodos[i] for i in historia[:longitudes[mejor], mejor]]
+    return camino, float(costos[mejor])
+
+def _reinicio(semilla, inicio, objetivo, opciones):
+    return temple_simulado_vectorizado(inicio, objetivo, semilla=semilla, **opciones)
+
+def temple_simulado_paralelo(inicio, objetivo, reinicios=4, procesos=None, semilla=None, **opciones):
+    """Reparte los reinicios entre procesos con semillas independientes y devuelve el mejor"""
+    semillas = np.random.SeedSequence(semilla).spawn(reinicios)
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        resultados = list(ejecutor.map(partial(_reinicio, inicio=inicio, objetivo=objetivo, opciones=opciones), semillas))
+    return min(resultados, key=lambda r: r[1])
+
+if __name__ == "__main__":
+    # Ejecutar búsqueda
+    camino = temple_simulado('A', 'G')
+    print("Camino encontrado con Temple Simulado:", " -> ".join(camino))
+
+    camino, _ = temple_simulado_paralelo('A', 'G', reinicios=4, cadenas=256,
+                                         enfriamiento=partial(enfriamiento_adaptativo, paciencia=5))
+    print("Camino encontrado con Temple Simulado paralelo:", " -> ".join(camino))
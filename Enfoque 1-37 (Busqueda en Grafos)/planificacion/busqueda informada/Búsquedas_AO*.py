@@ -1,3 +1,8 @@
+import heapq
+import math
+from collections import defaultdict
+from itertools import count
+
 # Estructura de grafo AND-OR: cada nodo tiene varias opciones (OR), y cada opción puede ser un conjunto de nodos (AND)
 grafo_ao = {
     'A': [[('B', 1)], [('C', 1), ('D', 1)]],  # A -> B (OR) o C y D (AND)
@@ -18,33 +23,125 @@ heuristica_ao = {
     'F': 0
 }
 
-solucion = {}
+def costo_opcion(opcion, costo):
+    return sum(peso + costo[hijo] for hijo, peso in opcion)
+
+def ao_star(raiz, grafo=grafo_ao, heuristica=heuristica_ao):
+    """
+    AO* con revisión de costos hacia los ancestros.
+
+    Un grafo solución no puede tener ciclos. Tras cada expansión los
+    ancestros afectados se revisan de abajo hacia arriba al estilo Dijkstra
+    (Knuth): un nodo se fija sólo con una opción cuyos hijos ya están fijos,
+    así que el grafo marcado es siempre acíclico y un ciclo sin salida deja
+    a sus nodos con costo infinito y sin resolver.
+    Devuelve (costo, grafo solución nodo -> mejor opción, resuelto); si la
+    raíz no se pudo resolver, el grafo es el mejor grafo parcial.
+    """
+    # Tabla por nodo: costo revisado, si está resuelto y su mejor opción
+    costo = {raiz: heuristica.get(raiz, 0)}
+    resuelto = {raiz: False}
+    mejor = {}
+    padres = defaultdict(set)
+    expandidos = set()
+    contador = count()  # Desempate en el montículo
+
+    def registrar(nodo):
+        if nodo not in costo:
+            costo[nodo] = heuristica.get(nodo, 0)
+            resuelto[nodo] = False
+
+    def revisar_ancestros(nodos):
+        # Zona: ancestros expandidos y sin resolver de los nodos recién expandidos
+        zona = set()
+        pila = list(nodos)
+        while pila:
+            nodo = pila.pop()
+            if nodo in zona or resuelto[nodo]:
+                continue
+            zona.add(nodo)
+            pila.extend(padre for padre in padres[nodo] if padre in expandidos)
+
+        # Cada opción espera a que se fijen sus hijos dentro de la zona
+        faltan = {}
+        monticulo = []
+        for nodo in zona:
+            costo[nodo] = math.inf
+            opciones = grafo.get(nodo, [])
+            if not opciones:
+                heapq.heappush(monticulo, (0, next(contador), nodo, None))
+            for i, opcion in enumerate(opciones):
+                faltan[nodo, i] = sum(hijo in zona for hijo, _ in opcion)
+                if not faltan[nodo, i]:
+                    heapq.heappush(monticulo, (costo_opcion(opcion, costo), next(contador), nodo, i))
 
-def ao_star(nodo):
-    if nodo not in grafo_ao or not grafo_ao[nodo]:
-        solucion[nodo] = []
-        return 0
+        fijados = set()
+        while monticulo:
+            c, _, nodo, i = heapq.heappop(monticulo)
+            if nodo in fijados:
+                continue
+            fijados.add(nodo)
+            opcion = [] if i is None else grafo[nodo][i]
+            costo[nodo], mejor[nodo] = c, opcion
+            resuelto[nodo] = all(resuelto[hijo] for hijo, _ in opcion)
+            for padre in padres[nodo]:
+                if padre not in zona or padre in fijados:
+                    continue
+                for j, opcion_padre in enumerate(grafo[padre]):
+                    usos = sum(hijo == nodo for hijo, _ in opcion_padre)
+                    if usos:
+                        faltan[padre, j] -= usos
+                        if not faltan[padre, j]:
+                            heapq.heappush(monticulo, (costo_opcion(opcion_padre, costo), next(contador), padre, j))
 
-    menor_costo = float('inf')
-    mejor_opcion = None
+        # Lo que no se pudo fijar sólo llega a sí mismo por ciclos
+        for nodo in zona - fijados:
+            mejor[nodo] = []
 
-    for opcion in grafo_ao[nodo]:
-        costo = 0
-        for hijo, peso in opcion:
-            costo += peso + heuristica_ao[hijo]
-        if costo < menor_costo:
-            menor_costo = costo
-            mejor_opcion = opcion
+    while not resuelto[raiz] and costo[raiz] < math.inf:
+        # Recorrer el mejor grafo solución parcial expandiendo sus puntas;
+        # cada nodo compartido se visita una sola vez por ronda
+        visitados = {raiz}
+        pila = [raiz]
+        nuevos = []
+        while pila:
+            nodo = pila.pop()
+            if resuelto[nodo]:
+                continue
+            if nodo not in expandidos:
+                expandidos.add(nodo)
+                nuevos.append(nodo)
+                for opcion in grafo.get(nodo, []):
+                    for hijo, _ in opcion:
+                        registrar(hijo)
+                        padres[hijo].add(nodo)
+                # Sólo se elige la opción para descender; costo y estado se revisan abajo
+                opciones = grafo.get(nodo, [])
+                mejor[nodo] = min(opciones, key=lambda op: costo_opcion(op, costo)) if opciones else []
+            for hijo, _ in mejor[nodo]:
+                if hijo not in visitados:
+                    visitados.add(hijo)
+                    pila.append(hijo)
 
-    solucion[nodo] = mejor_opcion
+        if not nuevos:
+            break  # Nada que expandir: el grafo parcial ya no puede mejorar
+        revisar_ancestros(nuevos)
 
-    for hijo, _ in mejor_opcion:
-        ao_star(hijo)
+    # Extraer el grafo solución siguiendo las mejores opciones
+    solucion = {}
+    pila = [raiz]
+    while pila:
+        nodo = pila.pop()
+        if nodo in solucion:
+            continue
+        solucion[nodo] = mejor.get(nodo, [])
+        pila.extend(hijo for hijo, _ in solucion[nodo])
 
-    return menor_costo
+    return costo[raiz], solucion, resuelto[raiz]
 
 # Ejecutar AO*
-ao_star('A')
+costo_total, solucion, _ = ao_star('A')
 print("Solución AO*:")
 for k, v in solucion.items():
     print(f"{k} -> {[n for n, _ in v]}")
+print("Costo estimado:", costo_total)